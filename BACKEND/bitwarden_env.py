@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import shutil
@@ -15,16 +16,14 @@ from pathlib import Path
 def _run_cli(
     bin_name: str,
     args: list[str],
-    env: dict[str, str],
     check: bool = True,
     input_text: str | None = None,
 ) -> str:
-    exe = _resolve_cli(bin_name, env)
+    exe = _resolve_cli(bin_name)
     proc = subprocess.run(
         [exe, *args],
         capture_output=True,
         text=True,
-        env=env,
         input=input_text,
     )
     if check and proc.returncode != 0:
@@ -50,48 +49,79 @@ def _parse_json(text: str, label: str) -> dict | list:
         raise RuntimeError(f"Failed to parse JSON from {label}.") from exc
 
 
-def _resolve_cli(bin_name: str, env: dict[str, str]) -> str:
-    found = shutil.which(bin_name)
+@functools.lru_cache(maxsize=8)
+def _resolve_cli_cached(bin_name: str, search_path: str, local_app_data: str) -> tuple[str, bool]:
+    """Return (executable, found); cached because which() stats every PATH entry."""
+    found = shutil.which(bin_name, path=search_path or None)
     if found:
-        return found
+        return found, True
     if os.name == "nt" and bin_name.lower() == "bws":
-        local = str(env.get("LOCALAPPDATA", "")).strip()
+        local = local_app_data.strip()
         if local:
             candidate = Path(local) / "bws" / "bws.exe"
             if candidate.exists():
-                return str(candidate)
-    return bin_name
+                return str(candidate), True
+    return bin_name, False
 
 
-def _require_bws(env: dict[str, str]) -> None:
-    exe = _resolve_cli("bws", env)
-    if shutil.which(exe) is not None:
-        return
-    if Path(exe).exists():
+def _resolve_cli(bin_name: str) -> str:
+    return _resolve_cli_cached(bin_name, os.environ.get("PATH", ""), os.environ.get("LOCALAPPDATA", ""))[0]
+
+
+def _require_bws() -> None:
+    _, found = _resolve_cli_cached("bws", os.environ.get("PATH", ""), os.environ.get("LOCALAPPDATA", ""))
+    if found:
         return
     raise RuntimeError("Bitwarden Secrets Manager CLI (bws) is not installed or not in PATH.")
 
 
+def _get_bw_item_via_serve(base_url: str, item_name: str) -> dict:
+    """Look up an item through an already running, unlocked `bw serve` (no Node cold start)."""
+    import requests
+
+    resp = requests.get(
+        f"{base_url.rstrip('/')}/list/object/items",
+        params={"search": item_name},
+        timeout=10,
+    )
+    payload = _parse_json(resp.text, "bw serve /list/object/items")
+    if not isinstance(payload, dict) or not payload.get("success"):
+        message = payload.get("message") if isinstance(payload, dict) else ""
+        raise RuntimeError(f"bw serve request failed (is the vault unlocked?): {message or resp.status_code}")
+    items = [item for item in ((payload.get("data") or {}).get("data") or []) if isinstance(item, dict)]
+    # Mirror `bw get item <name>`: exact name wins, otherwise the search must be unambiguous.
+    exact = [item for item in items if str(item.get("name") or "") == item_name]
+    matches = exact or items
+    if len(matches) != 1:
+        raise RuntimeError(f"Bitwarden item not found or ambiguous via bw serve: {item_name}")
+    return matches[0]
+
+
 def inject_github_env_from_bw(item_name: str = "projects-factory/github") -> None:
-    """Legacy: inject GITHUB_TOKEN/GITHUB_USERNAME from a personal-vault bw item."""
-    if shutil.which("bw") is None:
-        raise RuntimeError("Bitwarden CLI (bw) is not installed or not in PATH.")
-
-    env = os.environ.copy()
-    session = str(env.get("BW_SESSION", "")).strip()
-    if not session:
-        session = _run_cli("bw", ["unlock", "--raw"], env=env, check=True).strip()
+    """Legacy: inject GITHUB_TOKEN/GITHUB_USERNAME from a personal-vault bw item.
+
+    If BW_SERVE_URL points at a running `bw serve`, its REST API is used instead of the CLI.
+    """
+    serve_url = os.environ.get("BW_SERVE_URL", "").strip()
+    if serve_url:
+        item = _get_bw_item_via_serve(serve_url, item_name)
+    else:
+        if shutil.which("bw") is None:
+            raise RuntimeError("Bitwarden CLI (bw) is not installed or not in PATH.")
+
+        session = os.environ.get("BW_SESSION", "").strip()
         if not session:
-            raise RuntimeError("Failed to unlock Bitwarden vault.")
-        os.environ["BW_SESSION"] = session
-        env["BW_SESSION"] = session
-
-    item_json = _run_cli("bw", ["get", "item", "--session", session, item_name], env=env, check=True)
-    if not item_json:
-        raise RuntimeError(f"Bitwarden item not found: {item_name}")
-    item = _parse_json(item_json, "bw get item")
-    if not isinstance(item, dict):
-        raise RuntimeError("Unexpected JSON shape from bw get item.")
+            session = _run_cli("bw", ["unlock", "--raw"], check=True).strip()
+            if not session:
+                raise RuntimeError("Failed to unlock Bitwarden vault.")
+            os.environ["BW_SESSION"] = session
+
+        item_json = _run_cli("bw", ["get", "item", "--session", session, item_name], check=True)
+        if not item_json:
+            raise RuntimeError(f"Bitwarden item not found: {item_name}")
+        item = _parse_json(item_json, "bw get item")
+        if not isinstance(item, dict):
+            raise RuntimeError("Unexpected JSON shape from bw get item.")
 
     token = _get_field(item, "GITHUB_TOKEN") or str((item.get("login") or {}).get("password") or "").strip()
     username = _get_field(item, "GITHUB_USERNAME") or str((item.get("login") or {}).get("username") or "").strip()
@@ -107,32 +137,33 @@ def inject_github_env_from_bw(item_name: str = "projects-factory/github") -> Non
         os.environ["GITHUB_USERNAME"] = username
 
 
-def _list_bws_secrets(env: dict[str, str], project_id: str | None = None) -> list[dict]:
+def _list_bws_secrets(project_id: str | None = None) -> list[dict]:
     args = ["secret", "list"]
     if project_id:
         args.append(project_id)
-    payload = _run_cli("bws", args, env=env, check=True)
+    payload = _run_cli("bws", args, check=True)
     data = _parse_json(payload, "bws secret list")
     if not isinstance(data, list):
         raise RuntimeError("Unexpected JSON shape from bws secret list.")
     return [item for item in data if isinstance(item, dict)]
 
 
-def _find_bws_secret_by_key(secrets: list[dict], key: str) -> dict | None:
+def _index_bws_secrets_by_key(secrets: list[dict]) -> dict[str, dict]:
+    # setdefault keeps the first secret per key, matching the old linear search.
+    index: dict[str, dict] = {}
     for secret in secrets:
-        if str(secret.get("key") or "").strip() == key:
-            return secret
-    return None
+        index.setdefault(str(secret.get("key") or "").strip(), secret)
+    return index
 
 
-def _get_bws_secret_value(env: dict[str, str], secret: dict) -> str:
-    value = str(secret.get("value") or "").strip()
-    if value:
-        return value
+def _get_bws_secret_value(secret: dict) -> str:
+    # `bws secret list` already includes values; only fall back to `secret get` when the field is absent.
+    if "value" in secret:
+        return str(secret.get("value") or "").strip()
     secret_id = str(secret.get("id") or "").strip()
     if not secret_id:
         return ""
-    payload = _run_cli("bws", ["secret", "get", secret_id], env=env, check=True)
+    payload = _run_cli("bws", ["secret", "get", secret_id], check=True)
     data = _parse_json(payload, "bws secret get")
     if not isinstance(data, dict):
         return ""
@@ -143,43 +174,50 @@ def inject_github_env_from_bws(
     project_id: str | None = None,
     token_key: str = "GITHUB_TOKEN",
     username_key: str = "GITHUB_USERNAME",
+    secrets: list[dict] | None = None,
 ) -> None:
-    """Inject GITHUB_* env vars from Bitwarden Secrets Manager (bws)."""
-    env = os.environ.copy()
-    _require_bws(env)
-    access_token = str(env.get("BWS_ACCESS_TOKEN", "")).strip()
+    """Inject GITHUB_* env vars from Bitwarden Secrets Manager (bws).
+
+    Pass `secrets` (e.g. from verify_bws_capabilities) to skip another `bws secret list` run.
+    """
+    _require_bws()
+    access_token = os.environ.get("BWS_ACCESS_TOKEN", "").strip()
     if not access_token:
         raise RuntimeError("BWS_ACCESS_TOKEN is required for bws integration.")
 
-    secrets = _list_bws_secrets(env=env, project_id=project_id)
-    token_secret = _find_bws_secret_by_key(secrets, token_key)
+    if secrets is None:
+        secrets = _list_bws_secrets(project_id=project_id)
+    secrets_by_key = _index_bws_secrets_by_key(secrets)
+    token_secret = secrets_by_key.get(token_key)
     if not token_secret:
         scope_note = f" in project '{project_id}'" if project_id else ""
         raise RuntimeError(f"Secret '{token_key}' was not found{scope_note}.")
 
-    token = _get_bws_secret_value(env, token_secret)
+    token = _get_bws_secret_value(token_secret)
     if not token:
         raise RuntimeError(f"Secret '{token_key}' is empty.")
     os.environ["GITHUB_TOKEN"] = token
 
-    username_secret = _find_bws_secret_by_key(secrets, username_key)
+    username_secret = secrets_by_key.get(username_key)
     if username_secret:
-        username = _get_bws_secret_value(env, username_secret)
+        username = _get_bws_secret_value(username_secret)
         if username:
             os.environ["GITHUB_USERNAME"] = username
 
 
-def verify_bws_capabilities(require_write: bool = True, project_id: str | None = None) -> None:
-    """Verify bws token has required capabilities; optionally probes create/edit/delete."""
-    env = os.environ.copy()
-    _require_bws(env)
-    access_token = str(env.get("BWS_ACCESS_TOKEN", "")).strip()
+def verify_bws_capabilities(require_write: bool = True, project_id: str | None = None) -> list[dict]:
+    """Verify bws token has required capabilities; optionally probes create/edit/delete.
+
+    Returns the secrets listed during the read check so callers can reuse them.
+    """
+    _require_bws()
+    access_token = os.environ.get("BWS_ACCESS_TOKEN", "").strip()
     if not access_token:
         raise RuntimeError("BWS_ACCESS_TOKEN is required for bws integration.")
 
-    _list_bws_secrets(env=env, project_id=project_id)
+    secrets = _list_bws_secrets(project_id=project_id)
     if not require_write:
-        return
+        return secrets
 
     if not project_id:
         raise RuntimeError("BWS_REQUIRE_WRITE=1 requires BWS_PROJECT_ID to run CRUD permission probe.")
@@ -192,7 +230,6 @@ def verify_bws_capabilities(require_write: bool = True, project_id: str | None =
         created_text = _run_cli(
             "bws",
             ["secret", "create", probe_key, probe_value, project_id, "--note", probe_note],
-            env=env,
             check=True,
         )
         created = _parse_json(created_text, "bws secret create")
@@ -206,17 +243,17 @@ def verify_bws_capabilities(require_write: bool = True, project_id: str | None =
         _run_cli(
             "bws",
             ["secret", "edit", probe_id, "--value", edited_value],
-            env=env,
             check=True,
         )
-        _run_cli("bws", ["secret", "delete", probe_id], env=env, check=True)
+        _run_cli("bws", ["secret", "delete", probe_id], check=True)
     except Exception:
         if probe_id:
             try:
-                _run_cli("bws", ["secret", "delete", probe_id], env=env, check=False)
+                _run_cli("bws", ["secret", "delete", probe_id], check=False)
             except Exception:
                 pass
         raise
+    return secrets
 
 
 def inject_github_env_from_bitwarden(item_name: str = "projects-factory/github") -> None:
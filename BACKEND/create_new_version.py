@@ -4,15 +4,28 @@ from __future__ import annotations
 import argparse
 import io
 import keyword
+import os
 import re
 import subprocess
 import sys
+import tempfile
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable
 
 
 VERSION_PATTERN = re.compile(r"^\s*v(\d+)\.(\d+)\.(\d+)\b", re.MULTILINE)
 TOKEN_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9_]{2,}")
+CAMEL_PART_PATTERN = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)|\d+")
+# Added lines of a unified diff, excluding the "+++ b/file" headers.
+ADDED_LINE_PATTERN = re.compile(r"^\+(?!\+\+)(.*)$", re.MULTILINE)
+PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+FIX_WORDS_PATTERN = re.compile("|".join(map(re.escape, ("fix", "bug", "error", "guard", "validate", "fallback"))))
+REFACTOR_WORDS_PATTERN = re.compile("|".join(map(re.escape, ("refactor", "rename", "cleanup", "rework"))))
+# Stop-word sets below include PYTHON_KEYWORDS; split_identifier already drops words shorter than 3.
+# Only this much diff text is scanned for summary keywords.
+DIFF_CHAR_LIMIT = 20000
 
 
 def run_git(repo_root: Path, args: list[str]) -> str:
@@ -20,20 +33,68 @@ def run_git(repo_root: Path, args: list[str]) -> str:
         ["git", *args],
         cwd=repo_root,
         capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
         check=True,
     )
-    return result.stdout
+    # Git already emits "\n" line endings, so skip text-mode newline translation.
+    return result.stdout.decode("utf-8", "replace")
+
+
+def run_git_head(repo_root: Path, args: list[str], limit: int) -> str:
+    """Like run_git, but keep only the first `limit` bytes and stop git once they are read."""
+    # stderr goes to a temp file, not a pipe: git can warn far more than a pipe buffer holds
+    # (e.g. one autocrlf warning per file) while we are still reading stdout.
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            ["git", *args],
+            cwd=repo_root,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+        )
+        with proc:
+            head = proc.stdout.read(limit)
+            if proc.stdout.read(1):
+                # More output pending: nothing past the limit is used, so don't let git finish writing it.
+                proc.kill()
+                return head.decode("utf-8", "replace")
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, output=head, stderr=stderr_file.read())
+    return head.decode("utf-8", "replace")
+
+
+def run_parallel(calls: list[Callable[[], str]]) -> list[str]:
+    """Run independent read-only git calls concurrently; results keep input order."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+def read_version_tail(version_file: Path, chunk_size: int = 4096) -> str:
+    """Return enough of VERSION.md's tail to contain its last version line (whole file if none)."""
+    if not version_file.exists():
+        return ""
+    with version_file.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        read_size = chunk_size
+        while True:
+            start = max(0, size - read_size)
+            f.seek(start)
+            text = f.read().decode("utf-8", errors="replace")
+            if start > 0:
+                # Drop the (possibly cut) first line.
+                text = text.split("\n", 1)[-1]
+            if start == 0 or VERSION_PATTERN.search(text):
+                return text
+            read_size *= 2
 
 
 def parse_next_version(version_text: str) -> str:
-    matches = list(VERSION_PATTERN.finditer(version_text))
-    if not matches:
-        return "v0.0.1"
-    major, minor, patch = map(int, matches[-1].groups())
-    return f"v{major}.{minor}.{patch + 1}"
+    for line in reversed(version_text.splitlines()):
+        match = VERSION_PATTERN.match(line)
+        if match:
+            major, minor, patch = map(int, match.groups())
+            return f"v{major}.{minor}.{patch + 1}"
+    return "v0.0.1"
 
 
 def parse_name_status(raw: str) -> list[tuple[str, str]]:
@@ -52,21 +113,19 @@ def parse_name_status(raw: str) -> list[tuple[str, str]]:
     return items
 
 
+# Alternatives are tried in order, so the first matching group decides the scope.
+SCOPE_PATTERN = re.compile(
+    r"(FRONTEND/)|(BACKEND/)|(TEST|.*?/TEST)|(run\.py\Z)|(\.github/)|(.*\.md\Z)",
+    re.DOTALL,
+)
+SCOPE_BY_GROUP = (None, "frontend", "backend", "tests", "server", "ci", "docs")
+
+
 def scope_from_path(path: str) -> str:
-    p = path.replace("\\", "/")
-    if p.startswith("FRONTEND/"):
-        return "frontend"
-    if p.startswith("BACKEND/"):
-        return "backend"
-    if p.startswith("TEST") or "/TEST" in p:
-        return "tests"
-    if p in ("run.py", "BACKEND/main.py"):
-        return "server"
-    if p.startswith(".github/"):
-        return "ci"
-    if p.endswith(".md"):
-        return "docs"
-    return "project"
+    if "\\" in path:
+        path = path.replace("\\", "/")
+    match = SCOPE_PATTERN.match(path)
+    return SCOPE_BY_GROUP[match.lastindex] if match else "project"
 
 
 def summarize_changed_files(items: list[tuple[str, str]]) -> str:
@@ -78,143 +137,139 @@ def summarize_changed_files(items: list[tuple[str, str]]) -> str:
     return " + ".join(top_scopes)
 
 
+DIFF_STOP_WORDS = frozenset({
+    "for",
+    "while",
+    "if",
+    "elif",
+    "else",
+    "try",
+    "except",
+    "raise",
+    "pass",
+    "break",
+    "continue",
+    "def",
+    "str",
+    "int",
+    "bool",
+    "line",
+    "lines",
+    "word",
+    "words",
+    "text",
+    "count",
+    "counter",
+    "status",
+    "scope",
+    "update",
+    "updated",
+    "project",
+    "the",
+    "and",
+    "with",
+    "from",
+    "into",
+    "true",
+    "false",
+    "none",
+    "null",
+    "return",
+    "class",
+    "const",
+    "let",
+    "var",
+    "function",
+    "import",
+    "export",
+    "default",
+    "async",
+    "await",
+    "self",
+    "this",
+    "args",
+    "path",
+    "data",
+    "list",
+    "dict",
+    "string",
+    "value",
+    "values",
+    "items",
+    "index",
+    "main",
+    "utils",
+    "helper",
+    "helpers",
+    "tests",
+    "test",
+}) | PYTHON_KEYWORDS
+
+PATH_STOP_WORDS = frozenset({
+    "frontend",
+    "backend",
+    "version",
+    "readme",
+    "main",
+    "run",
+    "test",
+    "tests",
+    "index",
+    "init",
+    "app",
+    "utils",
+    "helper",
+    "helpers",
+    "create",
+    "new",
+    "version",
+    "python",
+    "file",
+}) | PYTHON_KEYWORDS
+
+
 def split_identifier(token: str) -> list[str]:
     parts: list[str] = []
     for chunk in token.split("_"):
         chunk = chunk.strip()
         if not chunk:
             continue
-        camel_parts = re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)|\d+", chunk)
+        camel_parts = CAMEL_PART_PATTERN.findall(chunk)
         parts.extend(camel_parts or [chunk])
     return [p.lower() for p in parts if len(p) >= 3 and not p.isdigit()]
 
 
 def keyword_counts_from_diff(diff_text: str) -> Counter[str]:
-    stop_words = {
-        "for",
-        "while",
-        "if",
-        "elif",
-        "else",
-        "try",
-        "except",
-        "raise",
-        "pass",
-        "break",
-        "continue",
-        "def",
-        "str",
-        "int",
-        "bool",
-        "line",
-        "lines",
-        "word",
-        "words",
-        "text",
-        "count",
-        "counter",
-        "status",
-        "scope",
-        "update",
-        "updated",
-        "project",
-        "the",
-        "and",
-        "with",
-        "from",
-        "into",
-        "true",
-        "false",
-        "none",
-        "null",
-        "return",
-        "class",
-        "const",
-        "let",
-        "var",
-        "function",
-        "import",
-        "export",
-        "default",
-        "async",
-        "await",
-        "self",
-        "this",
-        "args",
-        "path",
-        "data",
-        "list",
-        "dict",
-        "string",
-        "value",
-        "values",
-        "items",
-        "index",
-        "main",
-        "utils",
-        "helper",
-        "helpers",
-        "tests",
-        "test",
-    }
-    counts: Counter[str] = Counter()
-    for raw_line in diff_text.splitlines():
-        if not raw_line.startswith("+"):
-            continue
-        if raw_line.startswith("+++"):
-            continue
-        line = raw_line[1:]
-        for token in TOKEN_PATTERN.findall(line):
-            for word in split_identifier(token):
-                if word in stop_words or word in keyword.kwlist or len(word) < 3:
-                    continue
-                counts[word] += 1
-    return counts
+    added_text = "\n".join(ADDED_LINE_PATTERN.findall(diff_text))
+    # Counter(iterable) tallies in C (_count_elements) instead of a per-word += in Python.
+    return Counter(
+        word
+        for token in TOKEN_PATTERN.findall(added_text)
+        for word in split_identifier(token)
+        if word not in DIFF_STOP_WORDS
+    )
 
 
 def keyword_counts_from_paths(items: list[tuple[str, str]]) -> Counter[str]:
-    stop_words = {
-        "frontend",
-        "backend",
-        "version",
-        "readme",
-        "main",
-        "run",
-        "test",
-        "tests",
-        "index",
-        "init",
-        "app",
-        "utils",
-        "helper",
-        "helpers",
-        "create",
-        "new",
-        "version",
-        "python",
-        "file",
-    }
-    counts: Counter[str] = Counter()
-    for _, path in items:
-        normalized = path.replace("\\", "/")
-        for token in TOKEN_PATTERN.findall(normalized):
-            for word in split_identifier(token):
-                if word in stop_words or word in keyword.kwlist or len(word) < 3:
-                    continue
-                counts[word] += 1
-    return counts
-
-
-def infer_change_action(items: list[tuple[str, str]], keywords: Counter[str]) -> str:
+    return Counter(
+        word
+        for _, path in items
+        for token in TOKEN_PATTERN.findall(path.replace("\\", "/"))
+        for word in split_identifier(token)
+        if word not in PATH_STOP_WORDS
+    )
+
+
+def infer_change_action(items: list[tuple[str, str]], keywords: Iterable[str]) -> str:
     statuses = {status for status, _ in items}
-    joined = " ".join(keywords.keys())
+    joined = " ".join(keywords)
     if "A" in statuses or "??" in statuses:
         return "add"
     if "D" in statuses:
         return "remove"
-    if any(word in joined for word in ("fix", "bug", "error", "guard", "validate", "fallback")):
+    if FIX_WORDS_PATTERN.search(joined):
         return "fix"
-    if any(word in joined for word in ("refactor", "rename", "cleanup", "rework")):
+    if REFACTOR_WORDS_PATTERN.search(joined):
         return "refactor"
     return "update"
 
@@ -273,21 +328,28 @@ def scope_to_human(scope_text: str) -> str:
 
 
 def build_human_summary(repo_root: Path) -> str:
-    raw_status = run_git(repo_root, ["status", "--porcelain", "--untracked-files=all"])
+    # --no-optional-locks keeps the concurrent commands from contending for index.lock.
+    raw_status, raw_diff, raw_diff_cached = run_parallel([
+        lambda: run_git(repo_root, ["--no-optional-locks", "status", "--porcelain", "--untracked-files=all"]),
+        lambda: run_git_head(repo_root, ["--no-optional-locks", "diff", "--", ".", ":(exclude)VERSION.md"],
+                             DIFF_CHAR_LIMIT),
+        lambda: run_git_head(repo_root, ["--no-optional-locks", "diff", "--cached", "--", ".",
+                                         ":(exclude)VERSION.md"], DIFF_CHAR_LIMIT),
+    ])
     status_items = parse_name_status(raw_status)
     if not status_items:
         return "working tree clean"
 
-    raw_diff = run_git(repo_root, ["diff", "--", ".", ":(exclude)VERSION.md"])
-    raw_diff_cached = run_git(repo_root, ["diff", "--cached", "--", ".", ":(exclude)VERSION.md"])
-    combined_diff = f"{raw_diff}\n{raw_diff_cached}"[:20000]
+    combined_diff = f"{raw_diff}\n{raw_diff_cached}"[:DIFF_CHAR_LIMIT]
 
     scope_text = summarize_changed_files(status_items)
     scope_human = scope_to_human(scope_text)
     diff_keywords = keyword_counts_from_diff(combined_diff)
     path_keywords = keyword_counts_from_paths(status_items)
-    action = infer_change_action(status_items, diff_keywords + path_keywords)
-    token_set = set(diff_keywords.keys()) | set(path_keywords.keys()) | set(scope_human.lower().split())
+    # Only which keywords occur matters here, not their counts.
+    keyword_set = diff_keywords.keys() | path_keywords.keys()
+    action = infer_change_action(status_items, keyword_set)
+    token_set = keyword_set | set(scope_human.lower().split())
     feature = infer_feature_phrase(token_set, scope_human)
     return build_summary_phrase(action, feature)
 
@@ -298,12 +360,13 @@ def build_version_line(version_text: str, summary: str) -> str:
 
 
 def append_line(version_file: Path, line: str) -> None:
-    text = version_file.read_text(encoding="utf-8") if version_file.exists() else ""
-    needs_newline = bool(text) and not text.endswith("\n")
-    with version_file.open("a", encoding="utf-8", newline="\n") as f:
-        if needs_newline:
-            f.write("\n")
-        f.write(line + "\n")
+    # One handle for both the tail check and the append; only the last byte is read.
+    with version_file.open("a+b") as f:
+        needs_newline = False
+        if f.seek(0, os.SEEK_END):
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+        f.write((("\n" if needs_newline else "") + line + "\n").encode("utf-8"))
 
 
 def print_safe(text: str) -> None:
@@ -327,7 +390,7 @@ def main() -> int:
     repo_root = Path(args.repo_path).expanduser().resolve()
     version_file = repo_root / "VERSION.md"
 
-    version_text = version_file.read_text(encoding="utf-8") if version_file.exists() else ""
+    version_text = read_version_tail(version_file)
     summary = args.message.strip() or build_human_summary(repo_root)
     line = build_version_line(version_text, summary)
 
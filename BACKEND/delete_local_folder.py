@@ -14,6 +14,7 @@ Behavior goals (kept from the original):
 from __future__ import annotations
 
 import argparse
+import functools
 import io
 import json
 import os
@@ -21,10 +22,15 @@ import shutil
 import stat
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 def _ensure_utf8_stdio_on_windows() -> None:
     # Preserve the original intent: avoid UnicodeEncodeError in Windows console.
     if sys.platform == "win32":
@@ -32,6 +38,11 @@ def _ensure_utf8_stdio_on_windows() -> None:
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
 
+# Any of these makes a name more than one plain path component (or a drive spec on Windows).
+UNSAFE_NAME_CHARS = frozenset("/\\:\0" if sys.platform == "win32" else "/\0")
+
+
+@functools.lru_cache(maxsize=512)
 def _is_safe_repo_name(name: str) -> bool:
     """
     Reject anything that can escape the intended directories.
@@ -40,36 +51,149 @@ def _is_safe_repo_name(name: str) -> bool:
     if not name or name.strip() != name:
         return False
 
-    # Disallow path separators, drive letters, traversal, and absolute paths.
-    p = Path(name)
-    if p.is_absolute():
-        return False
-    if any(part in ("..", ".") for part in p.parts):
-        return False
-    if len(p.parts) != 1:
+    # Disallow path separators, drive letters and traversal. Without a separator or drive
+    # a name is a single relative component, so no Path object is needed.
+    if name in (".", ".."):
         return False
+    return UNSAFE_NAME_CHARS.isdisjoint(name)
 
-    # Also block Windows drive-like patterns (e.g., "C:foo" or "C:").
-    if sys.platform == "win32" and ":" in name:
-        return False
 
+FILE_ATTRIBUTE_NORMAL = 0x80
+SCANDIR_RMTREE_ATTEMPTS = 3
+RM_TIMEOUT_SEC = 600
+BATCH_LISTING_MIN_NAMES = 3
+USE_DIR_FD = os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd
+# Unlinks are syscall-bound; gains flatten out after a handful of threads.
+DELETE_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4), thread_name_prefix="rmtree")
+
+
+def _clear_attributes(path: str) -> bool:
+    """Drop read-only/system/hidden attributes; return False when there was nothing to clear."""
+    if sys.platform == "win32":
+        import ctypes
+
+        if ctypes.windll.kernel32.SetFileAttributesW(path, FILE_ATTRIBUTE_NORMAL):
+            return True
+    mode = os.lstat(path).st_mode
+    if stat.S_ISLNK(mode) or mode & stat.S_IWRITE:
+        return False
+    os.chmod(path, stat.S_IWRITE)
     return True
 
 
-def _onerror_rmtree(func, path, exc_info):
+def _remove_entry(remove, path: str) -> None:
+    try:
+        remove(path)
+    except PermissionError:
+        # Already-writable entries fail for other reasons (locks, parent perms); don't retry.
+        if not _clear_attributes(path):
+            raise
+        remove(path)
+
+
+def _is_link_stat(st: os.stat_result) -> bool:
+    # Junctions are reparse points but not S_ISLNK; never recurse into either kind of link.
+    if stat.S_ISLNK(st.st_mode):
+        return True
+    return sys.platform == "win32" and bool(st.st_file_attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _is_reparse_point(entry: os.DirEntry) -> bool:
+    return sys.platform == "win32" and _is_link_stat(entry.stat(follow_symlinks=False))
+
+
+def _unlink_in(parent: str, dir_fd: Optional[int], name: str) -> None:
+    if dir_fd is None:
+        _remove_entry(os.unlink, os.path.join(parent, name))
+        return
+    try:
+        os.unlink(name, dir_fd=dir_fd)
+    except PermissionError:
+        if not _clear_attributes(os.path.join(parent, name)):
+            raise
+        os.unlink(name, dir_fd=dir_fd)
+
+
+def _scandir_rmtree(path: str, pool: ThreadPoolExecutor | None = None) -> None:
+    """
+    Post-order delete without spawning processes or recursing in Python.
+    Junctions and directory symlinks are unlinked, never descended into.
+    With a pool, the unlinks of sibling files run concurrently.
+    Where supported, files are unlinked relative to an open directory fd (unlinkat), like rm does.
+    """
+    # (dir, emptied): a dir is pushed again under its children and removed once they are gone.
+    stack = [(path, False)]
+    while stack:
+        current, emptied = stack.pop()
+        if emptied:
+            _remove_entry(os.rmdir, current)
+            continue
+        stack.append((current, True))
+        dir_fd = os.open(current, os.O_RDONLY | os.O_DIRECTORY) if USE_DIR_FD else None
+        try:
+            names: list[str] = []
+            with os.scandir(current if dir_fd is None else dir_fd) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and not _is_reparse_point(entry):
+                        stack.append((os.path.join(current, entry.name), False))
+                    else:
+                        names.append(entry.name)
+            unlink = functools.partial(_unlink_in, current, dir_fd)
+            if pool is not None and len(names) > 1:
+                list(pool.map(unlink, names))
+            else:
+                for name in names:
+                    unlink(name)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+
+def _posix_rm_tree(target_path: Path) -> bool:
     """
-    Robust rmtree handler: if a file is read-only, make it writable and retry.
-    This helps on Windows and sometimes on macOS/Linux too.
+    Let coreutils/BSD rm (fts + unlinkat) do the bulk of the work; it beats a per-entry Python loop.
+    Return False when rm is unavailable or left something behind, so the caller can fall back.
     """
+    rm = shutil.which("rm")
+    if rm is None:
+        return False
     try:
-        os.chmod(path, stat.S_IWRITE)
-        func(path)
-    except Exception:
-        # Re-raise the original exception
-        raise
+        r = subprocess.run(
+            [rm, "-rf", "--", str(target_path)],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            timeout=RM_TIMEOUT_SEC,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return r.returncode == 0 and not os.path.lexists(target_path)
 
 
 def _windows_rmdir_tree(target_path: Path) -> tuple[bool, str]:
+    """
+    Delete in-process first; shell out to 'rmdir /S /Q' only if that keeps failing.
+    Return (success, diagnostics_message).
+    """
+    error: OSError | None = None
+    for attempt in range(SCANDIR_RMTREE_ATTEMPTS):
+        try:
+            _scandir_rmtree(str(target_path), DELETE_EXECUTOR)
+            return True, "deleted"
+        except FileNotFoundError:
+            if not target_path.exists():
+                return True, "deleted"
+        except OSError as e:
+            error = e
+        # Antivirus/indexer handles are usually released shortly.
+        time.sleep(0.1 * (attempt + 1))
+
+    ok, diag = _cmd_rmdir_tree(target_path)
+    if not ok and error is not None:
+        diag = f"{error}; {diag}"
+    return ok, diag
+
+
+def _cmd_rmdir_tree(target_path: Path) -> tuple[bool, str]:
     """
     Prefer 'rmdir /S /Q' for Windows to handle odd locked file cases.
     Return (success, diagnostics_message).
@@ -118,14 +242,36 @@ def _windows_rmdir_tree(target_path: Path) -> tuple[bool, str]:
         return False, str(e)
 
 
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    # One lstat answers "exists?", "is it a link?" and "is it a directory?".
+    try:
+        return path.lstat()
+    except OSError:
+        return None
+
+
+def _list_entries(path: Optional[Path]) -> dict[str, os.DirEntry]:
+    if path is None:
+        return {}
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
 def delete_repository(
     repo_name: str,
     my_repos_dir: Path,
     new_projects_dir: Optional[Path] = None,
     verbose: bool = True,
+    known_entries: Optional[dict[str, os.DirEntry]] = None,
+    log=print,
 ) -> tuple[str, str, str]:
     """
     Delete a repository folder from MY_REPOS or NEW_PROJECTS.
+    known_entries (name -> DirEntry, MY_REPOS winning) lets batch callers skip per-name stats.
+    Verbose progress notes go through log, so concurrent callers can buffer them per name.
 
     Returns: (repo_name, status, message)
     status ∈ {"success", "not_found", "error"}
@@ -133,19 +279,40 @@ def delete_repository(
     if not _is_safe_repo_name(repo_name):
         return repo_name, "error", "Invalid repository name (must be a single folder name, no paths)."
 
-    # Search order: MY_REPOS first, then NEW_PROJECTS (kept).
-    target_path = my_repos_dir / repo_name
-    if not target_path.exists() and new_projects_dir:
-        target_path = new_projects_dir / repo_name
-
-    if not target_path.exists():
-        return repo_name, "not_found", f"Directory '{repo_name}' does not exist in MY_REPOS or NEW_PROJECTS."
+    entry = known_entries.get(repo_name) if known_entries else None
+    if entry is not None:
+        target_path = Path(entry.path)
+        is_link = entry.is_symlink() or _is_reparse_point(entry)
+        is_dir = entry.is_dir(follow_symlinks=False)
+    else:
+        # Search order: MY_REPOS first, then NEW_PROJECTS (kept). Also covers names that only
+        # match case-insensitively, which a listing lookup misses.
+        target_path = my_repos_dir / repo_name
+        target_stat = _stat_or_none(target_path)
+        if target_stat is None and new_projects_dir:
+            target_path = new_projects_dir / repo_name
+            target_stat = _stat_or_none(target_path)
+
+        if target_stat is None:
+            return repo_name, "not_found", f"Directory '{repo_name}' does not exist in MY_REPOS or NEW_PROJECTS."
+        is_link = _is_link_stat(target_stat)
+        is_dir = stat.S_ISDIR(target_stat.st_mode)
+
+    if is_link:
+        # A linked repo folder: drop the link itself, leave the target untouched.
+        try:
+            os.unlink(target_path)
+        except OSError as e:
+            return repo_name, "error", str(e)
+        if verbose:
+            log(f"🔗 Removed link {target_path}")
+        return repo_name, "success", f"Deleted '{repo_name}'"
 
-    if not target_path.is_dir():
+    if not is_dir:
         return repo_name, "error", f"'{target_path}' is not a directory."
 
     if verbose:
-        print(f"🗑️  Deleting {target_path}...")
+        log(f"🗑️  Deleting {target_path}...")
 
     try:
         if sys.platform == "win32":
@@ -158,50 +325,76 @@ def delete_repository(
             if target_path.exists():
                 return repo_name, "error", f"Failed to delete '{repo_name}'"
         else:
-            shutil.rmtree(target_path, onerror=_onerror_rmtree)
+            if not _posix_rm_tree(target_path):
+                _scandir_rmtree(str(target_path), DELETE_EXECUTOR)
             if target_path.exists():
                 return repo_name, "error", f"Failed to delete '{repo_name}'"
 
         if verbose:
-            print("✅ Repository deleted successfully!")
+            log("✅ Repository deleted successfully!")
         return repo_name, "success", f"Deleted '{repo_name}'"
 
     except subprocess.TimeoutExpired:
         return repo_name, "error", "Deletion timed out"
     except Exception as e:
         if verbose:
-            print(f"❌ Error during deletion: {e}")
+            log(f"❌ Error during deletion: {e}")
         return repo_name, "error", str(e)
 
 
 def main(repo_names: list[str], as_json: bool = False) -> list[dict]:
-    script_dir = Path(__file__).resolve().parent
-    project_root = script_dir.parent
-    my_repos_dir = project_root / "MY_REPOS"
-    new_projects_dir = project_root / "NEW_PROJECTS"
+    my_repos_dir = PROJECT_ROOT / "MY_REPOS"
+    new_projects_dir = PROJECT_ROOT / "NEW_PROJECTS"
 
     if not repo_names:
         print("❌ No repository names provided.")
         return []
 
-    results: list[dict] = []
     verbose = not as_json  # keep JSON clean, like the intent of the original
+    unique_names = list(dict.fromkeys(repo_names))
+
+    # For batches, two directory listings are cheaper than probing both folders per name.
+    known_entries = None
+    if len(unique_names) >= BATCH_LISTING_MIN_NAMES:
+        known_entries = {**_list_entries(new_projects_dir), **_list_entries(my_repos_dir)}
+
+    def delete_one(repo_name: str) -> tuple[tuple[str, str, str], list[str]]:
+        notes: list[str] = []
+        outcome = delete_repository(
+            repo_name, my_repos_dir, new_projects_dir,
+            verbose=verbose, known_entries=known_entries, log=notes.append,
+        )
+        return outcome, notes
 
-    for repo_name in repo_names:
-        if verbose:
-            print("-" * 60)
+    # Each name is a separate top-level folder, so deletions can overlap. Duplicate names
+    # are deleted once; their notes are buffered and printed afterwards, in the order names were given.
+    if len(unique_names) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(unique_names), 8)) as pool:
+            outcomes = dict(zip(unique_names, pool.map(delete_one, unique_names)))
+    else:
+        outcomes = {name: delete_one(name) for name in unique_names}
 
-        name, status, message = delete_repository(repo_name, my_repos_dir, new_projects_dir, verbose=verbose)
+    results: list[dict] = []
+    lines: list[str] = []
+    noted: set[str] = set()
+    for repo_name in repo_names:
+        (name, status, message), notes = outcomes[repo_name]
         results.append({"name": name, "status": status, "message": message})
 
         if verbose:
+            if repo_name not in noted:
+                noted.add(repo_name)
+                lines.extend(notes)
+            lines.append("-" * 60)
             if status == "success":
-                print(f"✅ Deletion complete for '{name}'!")
+                lines.append(f"✅ Deletion complete for '{name}'!")
             elif status == "not_found":
-                print(f"⚠️  Repository '{name}' not found. Nothing to delete.")
+                lines.append(f"⚠️  Repository '{name}' not found. Nothing to delete.")
             else:
-                print(f"❌ {message}")
+                lines.append(f"❌ {message}")
 
+    if lines:
+        print("\n".join(lines))
     return results
 
 
@@ -209,6 +402,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Delete local repository folders from MY_REPOS/NEW_PROJECTS.")
     p.add_argument("repos", nargs="*", help="Repository folder names to delete (not paths).")
     p.add_argument("--json", action="store_true", help="Output results as JSON.")
+    p.add_argument("--stdin", action="store_true", help="Also read folder names from stdin, one per line.")
     return p.parse_args(argv)
 
 
@@ -216,14 +410,14 @@ if __name__ == "__main__":
     _ensure_utf8_stdio_on_windows()
 
     args = parse_args(sys.argv[1:])
+    if args.stdin:
+        args.repos.extend(line.strip() for line in sys.stdin if line.strip())
     results = main(args.repos, as_json=args.json)
 
     if args.json:
         print(json.dumps(results, ensure_ascii=False))
     else:
-        print("\n" + "=" * 60)
-        print("DELETION SUMMARY")
-        print("=" * 60)
+        lines = ["", "=" * 60, "DELETION SUMMARY", "=" * 60]
         for result in results:
             if result["status"] == "success":
                 status_icon, status_text = "✅", "deleted"
@@ -232,6 +426,7 @@ if __name__ == "__main__":
             else:
                 status_icon, status_text = "❌", "error"
 
-            print(f"{status_icon} {result['name']}: {status_text}")
+            lines.append(f"{status_icon} {result['name']}: {status_text}")
             if result.get("message") and result["status"] != "success":
-                print(f"   {result['message']}")
\ No newline at end of file
+                lines.append(f"   {result['message']}")
+        print("\n".join(lines))
\ No newline at end of file
@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
+import atexit
 import os
-from typing import Any
+from typing import Any, Iterator
 
 import requests
 from dotenv import load_dotenv
@@ -12,6 +13,8 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 GITHUB_API_BASE = "https://api.github.com"
+# Sessions keyed by token, so repeated fetches reuse pooled keep-alive/TLS connections.
+SESSIONS: dict[str, requests.Session] = {}
 
 
 def load_credentials() -> tuple[str, str]:
@@ -24,6 +27,9 @@ def load_credentials() -> tuple[str, str]:
 
 
 def build_session(token: str) -> requests.Session:
+    session = SESSIONS.get(token)
+    if session is not None:
+        return session
     session = requests.Session()
     session.headers.update(
         {
@@ -38,30 +44,52 @@ def build_session(token: str) -> requests.Session:
         read=5,
         backoff_factor=0.5,
         status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=frozenset(["GET"]),
+        # The GraphQL endpoint only reads here, so its POSTs are safe to retry.
+        allowed_methods=frozenset(["GET", "POST"]),
         raise_on_status=False,
     )
     adapter = HTTPAdapter(max_retries=retry)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
+    SESSIONS[token] = session
     return session
 
 
-def fetch_all_repos(username: str, token: str) -> list[dict[str, Any]]:
+@atexit.register
+def close_sessions() -> None:
+    for session in SESSIONS.values():
+        session.close()
+    SESSIONS.clear()
+
+
+REPOS_QUERY = """
+query($cursor: String) {
+  viewer {
+    repositories(first: 100, ownerAffiliations: OWNER, after: $cursor) {
+      pageInfo { endCursor hasNextPage }
+      nodes { name url isPrivate description createdAt }
+    }
+  }
+}
+"""
+
+
+def iter_repos(token: str) -> Iterator[dict[str, Any]]:
+    """Yield repo nodes page by page, so each raw page can be dropped once consumed."""
+    # GraphQL returns just the fields the UI shows instead of ~80 REST fields per repo.
     session = build_session(token)
-    url = f"{GITHUB_API_BASE}/user/repos"
-    params = {"affiliation": "owner", "per_page": 100, "page": 1}
+    url = f"{GITHUB_API_BASE}/graphql"
+    variables: dict[str, Any] = {"cursor": None}
     timeout = (5, 30)
-    all_repos: list[dict[str, Any]] = []
 
     while True:
-        resp = session.get(url, params=params, timeout=timeout)
-        if resp.status_code >= 400:
-            try:
-                payload = resp.json()
-            except Exception:
-                payload = None
+        resp = session.post(url, json={"query": REPOS_QUERY, "variables": variables}, timeout=timeout)
+        try:
+            payload = resp.json()
+        except Exception:
+            payload = None
 
+        if resp.status_code >= 400:
             if resp.status_code == 403 and resp.headers.get("X-RateLimit-Remaining") == "0":
                 reset = resp.headers.get("X-RateLimit-Reset")
                 raise RuntimeError(f"GitHub rate limit exceeded. X-RateLimit-Reset={reset}")
@@ -69,31 +97,36 @@ def fetch_all_repos(username: str, token: str) -> list[dict[str, Any]]:
             msg = payload.get("message") if isinstance(payload, dict) else resp.text
             raise RuntimeError(f"GitHub API error {resp.status_code}: {msg}")
 
-        repos = resp.json()
-        if not isinstance(repos, list):
-            raise RuntimeError(f"Unexpected GitHub response shape: {type(repos)}")
+        if not isinstance(payload, dict):
+            raise RuntimeError(f"Unexpected GitHub response shape: {type(payload)}")
+        if payload.get("errors"):
+            msg = "; ".join(str(err.get("message", err)) for err in payload["errors"])
+            raise RuntimeError(f"GitHub API error: {msg}")
 
-        if not repos:
+        connection = payload["data"]["viewer"]["repositories"]
+        yield from (node for node in connection["nodes"] if node)
+        page_info = connection["pageInfo"]
+        if not page_info["hasNextPage"]:
             break
-        all_repos.extend(repos)
-        params["page"] += 1
+        variables["cursor"] = page_info["endCursor"]
 
-    return all_repos
+
+def fetch_all_repos(username: str, token: str) -> list[dict[str, Any]]:
+    return list(iter_repos(token))
 
 
 def to_compact_repo(repo: dict[str, Any]) -> dict[str, Any]:
     return {
         "name": repo.get("name", ""),
-        "url": repo.get("html_url", ""),
-        "private": bool(repo.get("private", False)),
+        "url": repo.get("url", ""),
+        "private": bool(repo.get("isPrivate", False)),
         "description": repo.get("description") or "",
-        "created_at": repo.get("created_at") or "",
+        "created_at": repo.get("createdAt") or "",
     }
 
 
 def fetch_compact_repos(username: str, token: str) -> list[dict[str, Any]]:
-    repos = fetch_all_repos(username, token)
-    return [to_compact_repo(repo) for repo in repos]
+    return [to_compact_repo(repo) for repo in iter_repos(token)]
 
 
 def main() -> None:
@@ -21,17 +21,33 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import io
 import json
+import os
 import re
 import shutil
 import subprocess
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_REPO = "https://github.com/israice/Create-Project-Folder.git"
+MAX_PARALLEL_CLONES = 4
+# Lines of git stderr kept for error messages.
+STDERR_TAIL_LINES = 20
+# scp-like remote tail: git@host:org/repo(.git)
+SCP_URL_RE = re.compile(r":([^/]+)/([^/]+)$")
+# --shallow: latest commit only (--depth implies --single-branch). Full clones stay the default
+# because installed repos are edited and pushed from here.
+SHALLOW_CLONE_ARGS = ["--depth", "1"]
+# Abort transfers that stay below 1 KB/s for a minute instead of hanging until the timeout.
+LOW_SPEED_ENV = {"GIT_HTTP_LOW_SPEED_LIMIT": "1000", "GIT_HTTP_LOW_SPEED_TIME": "60"}
 
 
 def _ensure_utf8_stdio_on_windows() -> None:
@@ -40,11 +56,6 @@ def _ensure_utf8_stdio_on_windows() -> None:
         sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="replace")
 
 
-def _project_root_from_script() -> Path:
-    script_dir = Path(__file__).resolve().parent
-    return script_dir.parent
-
-
 def _require_git() -> None:
     if shutil.which("git") is None:
         raise RuntimeError("git was not found in PATH. Please install Git and try again.")
@@ -64,7 +75,7 @@ def _repo_name_from_url(repo_url: str) -> str:
     u = u.rstrip("/")
 
     # Handle scp-like syntax: git@github.com:org/repo(.git)
-    m = re.search(r":([^/]+)/([^/]+)$", u)
+    m = SCP_URL_RE.search(u)
     if m:
         name = m.group(2)
     else:
@@ -80,85 +91,159 @@ def _repo_name_from_url(repo_url: str) -> str:
     return name
 
 
-def clone_repository(repo_url: str, target_path: Path) -> None:
+def clone_repository(
+    repo_url: str,
+    target_path: Path,
+    log: Callable[[str], None] = print,
+    shallow: bool = False,
+) -> None:
     if target_path.exists():
-        print(f"⚠️  Directory '{target_path}' already exists. Skipping...")
+        log(f"⚠️  Directory '{target_path}' already exists. Skipping...")
         return
 
-    print(f"📥 Cloning {repo_url} into {target_path}...")
-
-    # Capture output so errors are readable and we can still show them.
-    proc = subprocess.run(
-        ["git", "clone", repo_url, str(target_path)],
-        text=True,
-        capture_output=True,
+    log(f"📥 Cloning {repo_url} into {target_path}...")
+
+    # Stream git's messages as they arrive; only a short tail is kept for the error text.
+    # Git reports progress to a pipe only with --progress. It repaints each phase with "\r";
+    # those repaints are skipped and the finished line of every phase is logged.
+    # Never prompt for credentials: clones may run concurrently and nobody is at the terminal.
+    clone_args = SHALLOW_CLONE_ARGS if shallow else []
+    proc = subprocess.Popen(
+        ["git", "clone", "--progress", *clone_args, repo_url, str(target_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env={**LOW_SPEED_ENV, **os.environ, "GIT_TERMINAL_PROMPT": "0"},
     )
+    stderr_tail: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+    with proc:
+        for line in io.TextIOWrapper(proc.stderr, encoding="utf-8", errors="replace", newline=""):
+            if line.endswith("\r"):
+                continue
+            line = line.rstrip()
+            if line:
+                stderr_tail.append(line)
+                log(f"   {line}")
     if proc.returncode != 0:
-        details = (proc.stderr or proc.stdout or "").strip()
-        raise subprocess.CalledProcessError(proc.returncode, proc.args, output=proc.stdout, stderr=proc.stderr) from None
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, stderr="\n".join(stderr_tail))
 
-    print("✅ Repository cloned successfully!")
+    log("✅ Repository cloned successfully!")
 
 
-def install_repo(repo_url: str, my_repos_dir: Path) -> tuple[Path, str]:
+def install_repo(
+    repo_url: str,
+    my_repos_dir: Path,
+    log: Callable[[str], None] = print,
+    shallow: bool = False,
+) -> tuple[Path, str]:
     repo_name = _repo_name_from_url(repo_url)
     target_path = my_repos_dir / repo_name
 
     if target_path.exists():
         return target_path, "skipped"
 
-    clone_repository(repo_url, target_path)
+    clone_repository(repo_url, target_path, log, shallow)
     return target_path, "installed"
 
 
-def main(repo_urls: Optional[list[str]] = None, as_json: bool = False) -> list[dict]:
+class _OrderedLog:
+    """Print per-URL log lines in input order: the URL at the head live, later ones when their turn comes."""
+
+    def __init__(self, count: int) -> None:
+        self._lock = threading.Lock()
+        self._head = 0
+        self._pending: list[list[str]] = [[] for _ in range(count)]
+
+    def write(self, index: int, line: str) -> None:
+        with self._lock:
+            if index == self._head:
+                print(line, flush=True)
+            else:
+                self._pending[index].append(line)
+
+    def advance(self) -> None:
+        """Mark the head URL finished and flush what the next one logged while it waited."""
+        with self._lock:
+            self._head += 1
+            if self._head < len(self._pending):
+                lines, self._pending[self._head] = self._pending[self._head], []
+                if lines:
+                    print("\n".join(lines), flush=True)
+
+
+def _install_one(repo_url: str, my_repos_dir: Path, log: Callable[[str], None], shallow: bool) -> dict:
+    try:
+        target_path, status = install_repo(repo_url, my_repos_dir, log, shallow)
+        repo_name = target_path.name
+
+        if status == "skipped":
+            log(f"⚠️  Repository '{repo_name}' already exists. Skipping.")
+            return {"name": repo_name, "url": repo_url, "path": str(target_path), "status": "skipped"}
+
+        log(f"✅ Installation complete for '{repo_name}'!")
+        log(f"📁 Repository location: {target_path}")
+        return {"name": repo_name, "url": repo_url, "path": str(target_path), "status": "success"}
+
+    except subprocess.CalledProcessError as e:
+        # Make error readable; include stderr when available.
+        stderr = getattr(e, "stderr", None)
+        err_text = (stderr or str(e)).strip()
+        log(f"❌ Error during installation: {err_text}")
+    except Exception as e:
+        err_text = str(e).strip()
+        log(f"❌ Unexpected error: {err_text}")
+    return {"name": repo_url, "url": repo_url, "path": "", "status": "error", "error": err_text}
+
+
+def _install_group(
+    indexes: list[int], repo_urls: list[str], my_repos_dir: Path, output: Optional[_OrderedLog], shallow: bool
+) -> list[dict]:
+    results = []
+    for index in indexes:
+        log = functools.partial(output.write, index) if output else (lambda _line: None)
+        if output:
+            log("-" * 60)
+        results.append(_install_one(repo_urls[index], my_repos_dir, log, shallow))
+    return results
+
+
+def _clone_key(repo_url: str) -> str:
+    try:
+        return _repo_name_from_url(repo_url)
+    except ValueError:
+        return repo_url
+
+
+def main(repo_urls: Optional[list[str]] = None, as_json: bool = False, shallow: bool = False) -> list[dict]:
     _require_git()
 
-    project_root = _project_root_from_script()
-    my_repos_dir = project_root / "MY_REPOS"
+    my_repos_dir = PROJECT_ROOT / "MY_REPOS"
     my_repos_dir.mkdir(exist_ok=True)
 
     if not repo_urls:
         repo_urls = [DEFAULT_REPO]
 
+    output = None if as_json else _OrderedLog(len(repo_urls))  # keep JSON clean
+
+    # URLs that land in the same folder stay sequential (the later one is skipped, as before);
+    # distinct folders clone concurrently.
+    groups: dict[str, list[int]] = {}
+    for index, repo_url in enumerate(repo_urls):
+        groups.setdefault(_clone_key(repo_url), []).append(index)
     results: list[dict] = []
-    verbose = not as_json  # keep JSON clean
-
-    for repo_url in repo_urls:
-        if verbose:
-            print("-" * 60)
-
-        try:
-            target_path, status = install_repo(repo_url, my_repos_dir)
-            repo_name = target_path.name
-
-            if status == "skipped":
-                if verbose:
-                    print(f"⚠️  Repository '{repo_name}' already exists. Skipping.")
-                results.append(
-                    {"name": repo_name, "url": repo_url, "path": str(target_path), "status": "skipped"}
-                )
-            else:
-                if verbose:
-                    print(f"✅ Installation complete for '{repo_name}'!")
-                    print(f"📁 Repository location: {target_path}")
-                results.append(
-                    {"name": repo_name, "url": repo_url, "path": str(target_path), "status": "success"}
-                )
-
-        except subprocess.CalledProcessError as e:
-            # Make error readable; include stderr when available.
-            stderr = getattr(e, "stderr", None)
-            err_text = (stderr or str(e)).strip()
-            if verbose:
-                print(f"❌ Error during installation: {err_text}")
-            results.append({"name": repo_url, "url": repo_url, "path": "", "status": "error", "error": err_text})
-
-        except Exception as e:
-            err_text = str(e).strip()
-            if verbose:
-                print(f"❌ Unexpected error: {err_text}")
-            results.append({"name": repo_url, "url": repo_url, "path": "", "status": "error", "error": err_text})
+    with ThreadPoolExecutor(max_workers=min(len(groups), MAX_PARALLEL_CLONES)) as pool:
+        futures = {key: pool.submit(_install_group, indexes, repo_urls, my_repos_dir, output, shallow)
+                   for key, indexes in groups.items()}
+        outcomes: dict[str, Iterator[dict]] = {}
+        # Walk the input order. The URL at the head prints live; the others buffer until every
+        # earlier URL is done, so output never interleaves.
+        for repo_url in repo_urls:
+            key = _clone_key(repo_url)
+            if key not in outcomes:
+                outcomes[key] = iter(futures[key].result())
+            results.append(next(outcomes[key]))
+            if output is not None:
+                output.advance()
 
     return results
 
@@ -167,6 +252,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Clone Git repositories into ../MY_REPOS.")
     p.add_argument("repo_urls", nargs="*", help="Repository URLs to clone.")
     p.add_argument("--json", action="store_true", help="Output results as JSON.")
+    p.add_argument("--stdin", action="store_true", help="Also read repository URLs from stdin, one per line.")
+    p.add_argument("--shallow", action="store_true", help="Clone only the latest commit of the default branch.")
     return p.parse_args(argv)
 
 
@@ -174,14 +261,14 @@ if __name__ == "__main__":
     _ensure_utf8_stdio_on_windows()
 
     args = parse_args(sys.argv[1:])
-    results = main(args.repo_urls, as_json=args.json)
+    if args.stdin:
+        args.repo_urls.extend(line.strip() for line in sys.stdin if line.strip())
+    results = main(args.repo_urls, as_json=args.json, shallow=args.shallow)
 
     if args.json:
         print(json.dumps(results, ensure_ascii=False))
     else:
-        print("\n" + "=" * 60)
-        print("INSTALLATION SUMMARY")
-        print("=" * 60)
+        lines = ["", "=" * 60, "INSTALLATION SUMMARY", "=" * 60]
         for result in results:
             if result["status"] == "success":
                 status_icon, status_text = "✅", "installed"
@@ -190,9 +277,10 @@ if __name__ == "__main__":
             else:
                 status_icon, status_text = "❌", "error"
 
-            print(f"{status_icon} {result['name']}: {status_text}")
+            lines.append(f"{status_icon} {result['name']}: {status_text}")
 
             if result["status"] in ("success", "skipped"):
-                print(f"   Location: {result['path']}")
+                lines.append(f"   Location: {result['path']}")
             elif "error" in result:
-                print(f"   Error: {result['error']}")
\ No newline at end of file
+                lines.append(f"   Error: {result['error']}")
+        print("\n".join(lines))
\ No newline at end of file
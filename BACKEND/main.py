@@ -4,6 +4,9 @@ GitHub Projects Manager - Simplified Single-File Version
 Run with: python run.py
 """
 
+import asyncio
+import errno
+import functools
 import json
 import mimetypes
 import os
@@ -11,13 +14,16 @@ import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 import warnings
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import ip_address
-from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from stat import S_ISREG
 from urllib.parse import quote
 from SETTINGS import PYTHONDONTWRITEBYTECODE
 
@@ -28,7 +34,7 @@ sys.dont_write_bytecode = str(PYTHONDONTWRITEBYTECODE).strip().lower() in ("1",
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from BACKEND.api_models import (
     AddToGithubPayload,
@@ -43,9 +49,12 @@ from BACKEND.api_models import (
 from BACKEND.get_all_github_projects import fetch_compact_repos
 from SETTINGS import (
     CREATE_PROJECT_REPO_URL,
+    AVATAR_CACHE_TTL_SEC,
     GIT_STATE_TTL_SEC,
+    PUSH_STATES_REUSE_SEC,
     SERVER_HOST,
     SERVER_PORT,
+    SHALLOW_CLONES,
     TIMEOUT_CREATE_PROJECT,
     TIMEOUT_DELETE_PER_REPO,
     TIMEOUT_GIT_PUSH,
@@ -74,6 +83,9 @@ FRONTEND_DIR = BASE_DIR / "FRONTEND"
 BACKEND_DIR = BASE_DIR / "BACKEND"
 MY_REPOS_DIR = BASE_DIR / "MY_REPOS"
 NEW_PROJECTS_DIR = BASE_DIR / "NEW_PROJECTS"
+AVATAR_CACHE_FILE = BACKEND_DIR / ".avatar_cache.json"
+GITHUB_REPOS_CACHE_FILE = BACKEND_DIR / ".github_repos_cache.json"
+GIT_STATE_CACHE_FILE = BACKEND_DIR / ".git_state_cache.json"
 
 GITHUB_USERNAME = os.getenv("GITHUB_USERNAME", "Unknown")
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
@@ -106,56 +118,111 @@ CORS_ORIGINS = default_cors_for_port(PORT)
 app = FastAPI(title="GitHub Projects Manager")
 app.add_middleware(CORSMiddleware, allow_origins=CORS_ORIGINS, allow_credentials=False,
                    allow_methods=["*"], allow_headers=["*"])
-app.mount("/static", StaticFiles(directory=str(FRONTEND_DIR)), name="static")
 
 
-@app.middleware("http")
-async def force_static_200(request: Request, call_next):
-    if request.url.path.startswith("/static/"):
-        # Remove conditional request headers so static responses are sent as 200.
-        headers = request.scope.get("headers") or []
-        request.scope["headers"] = [
-            (k, v) for (k, v) in headers
-            if k.lower() not in (b"if-none-match", b"if-modified-since")
-        ]
-    response = await call_next(request)
-    if request.url.path.startswith("/static/"):
-        response.headers["Cache-Control"] = "no-store"
-    return response
+# Static/frontend files are revalidated via ETag (304 when unchanged); DEV_NO_CACHE=1 restores
+# the old always-200, no-store behaviour.
+DEV_NO_CACHE = os.getenv("DEV_NO_CACHE", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+class FrontendStaticFiles(StaticFiles):
+    # Cache headers live here rather than in an HTTP middleware, so API requests don't pay for it.
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        if DEV_NO_CACHE:
+            # Ignore conditional request headers so static responses are always sent as 200.
+            return FileResponse(full_path, status_code=status_code, stat_result=stat_result,
+                                headers={"Cache-Control": "no-store"})
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
 
+app.mount("/static", FrontendStaticFiles(directory=str(FRONTEND_DIR)), name="static")
 
-@dataclass
-class Project:
-    name: str
-    url: str
-    private: bool
-    description: str
-    created_at: str
-    is_new_project: bool = False
 
-    def as_dict(self):
-        return {"name": self.name, "url": self.url, "private": self.private,
-                "description": self.description, "created_at": self.created_at,
-                "is_new_project": self.is_new_project}
+# "generation" is bumped by invalidate_runtime_caches so a scan that was already running
+# when the repos changed does not cache its (possibly pre-change) results.
+GIT_STATE_CACHE = {"by_path": {}, "by_remote": {}, "started_at": 0.0, "expires_at": 0.0, "generation": 0}
+GIT_STATE_LOCK = threading.Lock()
+GITHUB_REPOS_LOCK = threading.Lock()
+GITHUB_REPOS_CACHE = {"items": [], "fetched_at": 0.0, "expires_at": 0.0}
+INSTALLED_URLS_CACHE = {"urls": set(), "key": None, "expires_at": 0.0}
+AVATAR_CACHE = {"url": "", "expires_at": 0.0}
+# folder name / normalized origin url -> resolved project dir under MY_REPOS or NEW_PROJECTS;
+# "resolved" memoizes resolve_project_path results and is dropped with the index.
+PROJECT_INDEX_CACHE = {"by_name": {}, "by_remote": {}, "resolved": {}, "key": None, "expires_at": 0.0}
+HTTP_SESSION = None
+# git config path -> ((st_mtime_ns, st_size), origin url)
+ORIGIN_URL_CACHE = {}
+# Shared pool for per-repo git subprocess fan-out (IO bound, so threads are enough).
+GIT_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="git-state")
 
 
-GIT_STATE_CACHE = {"by_path": {}, "by_remote": {}, "expires_at": 0.0}
-GITHUB_REPOS_CACHE = {"items": [], "expires_at": 0.0}
+@functools.lru_cache(maxsize=1024)
+def _realpath(path: str):
+    # Lookup keys for states_by_path; repeated polls resolve the same folders every time.
+    return os.path.realpath(path)
 
 
-def invalidate_runtime_caches():
+def invalidate_runtime_caches(github=True):
+    # Local-only changes (clone, delete, rename folder, push) leave the GitHub repo list as is.
+    _realpath.cache_clear()
+    GIT_STATE_CACHE["generation"] += 1
     GIT_STATE_CACHE["expires_at"] = 0.0
-    GITHUB_REPOS_CACHE["expires_at"] = 0.0
+    INSTALLED_URLS_CACHE["expires_at"] = 0.0
+    PROJECT_INDEX_CACHE["expires_at"] = 0.0
+    GIT_STATE_CACHE_FILE.unlink(missing_ok=True)
+    if github:
+        GITHUB_REPOS_CACHE["expires_at"] = 0.0
+        GITHUB_REPOS_CACHE_FILE.unlink(missing_ok=True)
+
+
+def _read_json_cache(path: Path):
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_json_cache(path: Path, data: dict):
+    # Write-then-rename so a crash or a concurrent reader never sees a half-written file.
+    # The tmp name is unique per call, so threads and WORKERS>1 processes never share it.
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data))
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.warning("Cannot write cache file %s: %s", path.name, exc)
+        if tmp:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 
-def run_script(script: Path, args=None, timeout=None, cwd: Path | None = None):
+# Stay well below the Windows command-line limit (32767 chars) when passing lists as argv.
+MAX_SCRIPT_ARGV_CHARS = 8000
+
+
+def script_list_args(items):
+    """Return (args, input_text) for a batch script; long lists go through stdin."""
+    items = [str(item) for item in items]
+    if sum(len(item) + 1 for item in items) <= MAX_SCRIPT_ARGV_CHARS:
+        return items, None
+    return ["--stdin"], "\n".join(items)
+
+
+def run_script(script: Path, args=None, timeout=None, cwd: Path | None = None, input_text: str | None = None):
     cmd = [sys.executable, str(script)] + (args or [])
     env = os.environ.copy()
     env["PYTHONDONTWRITEBYTECODE"] = str(PYTHONDONTWRITEBYTECODE)
     # Guard child Python processes from broken interpreter env overrides.
     env.pop("PYTHONHOME", None)
     env.pop("PYTHONPATH", None)
-    result = subprocess.run(cmd, capture_output=True, text=True,
+    result = subprocess.run(cmd, capture_output=True, text=True, input=input_text,
                           timeout=timeout, encoding='utf-8', errors='replace', env=env,
                           cwd=str(cwd) if cwd else None)
     if result.returncode != 0:
@@ -163,6 +230,13 @@ def run_script(script: Path, args=None, timeout=None, cwd: Path | None = None):
     return result
 
 
+async def run_script_async(script: Path, args=None, timeout=None, cwd: Path | None = None,
+                           input_text: str | None = None):
+    # Worker thread rather than asyncio subprocesses: uvicorn's Windows reload loop
+    # is a SelectorEventLoop, which cannot spawn child processes.
+    return await asyncio.to_thread(run_script, script, args, timeout, cwd, input_text)
+
+
 def run_command(cmd, cwd=None, timeout=None):
     result = subprocess.run(
         cmd,
@@ -178,40 +252,60 @@ def run_command(cmd, cwd=None, timeout=None):
     return result
 
 
+async def run_command_async(cmd, cwd=None, timeout=None):
+    # Same worker-thread approach as run_script_async; git/gh can run for minutes.
+    return await asyncio.to_thread(run_command, cmd, cwd, timeout)
+
+
+NON_FAST_FORWARD_RE = re.compile("|".join(map(re.escape, (
+    "non-fast-forward",
+    "[rejected]",
+    "fetch first",
+    "tip of your current branch is behind",
+    "failed to push some refs",
+))), re.IGNORECASE)
+
+
 def is_non_fast_forward_error(message: str) -> bool:
-    text = (message or "").lower()
-    markers = (
-        "non-fast-forward",
-        "[rejected]",
-        "fetch first",
-        "tip of your current branch is behind",
-        "failed to push some refs",
-    )
-    return any(marker in text for marker in markers)
+    return NON_FAST_FORWARD_RE.search(message or "") is not None
+
+
+VERSION_TAIL_BYTES = 4096
 
 
 def get_last_version_line(repo_root: Path) -> str:
     version_file = repo_root / "VERSION.md"
-    if not version_file.exists():
-        return ""
     try:
-        lines = version_file.read_text(encoding="utf-8", errors="replace").splitlines()
+        with version_file.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            # Read only the tail; widen it when it holds no complete non-empty line.
+            chunk = VERSION_TAIL_BYTES
+            while True:
+                start = max(0, size - chunk)
+                f.seek(start)
+                lines = f.read().splitlines()
+                if start:
+                    lines = lines[1:]  # may be cut mid-line
+                for line in reversed(lines):
+                    text = line.decode("utf-8", errors="replace").strip()
+                    if text:
+                        return text
+                if not start:
+                    return ""
+                chunk *= 4
     except Exception:
         return ""
-    for line in reversed(lines):
-        text = line.strip()
-        if text:
-            return text
-    return ""
 
 
-def is_image_file(path: Path) -> bool:
-    if not path.is_file():
-        return False
-    media_type, _ = mimetypes.guess_type(str(path))
-    if media_type and media_type.startswith("image/"):
-        return True
-    return path.suffix.lower() in (".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".svg", ".ico")
+IMAGE_MEDIA_TYPES = {
+    ".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".gif": "image/gif",
+    ".webp": "image/webp", ".bmp": "image/bmp", ".svg": "image/svg+xml", ".ico": "image/x-icon",
+    ".tif": "image/tiff", ".tiff": "image/tiff", ".avif": "image/avif", ".heic": "image/heic",
+}
+
+
+def image_media_type(name: str):
+    return IMAGE_MEDIA_TYPES.get(os.path.splitext(name)[1].lower())
 
 
 def get_project_screenshots_dir(project_root: Path) -> Path:
@@ -235,54 +329,144 @@ def ensure_create_project_script():
     return script
 
 
+def scan_subdirs(root: Path):
+    """Return DirEntry objects for child directories; d_type from readdir avoids a stat per child."""
+    try:
+        with os.scandir(root) as it:
+            return [entry for entry in it if entry.is_dir()]
+    except FileNotFoundError:
+        return []
+
+
+def _git_config_path(repo_dir: Path):
+    git_path = repo_dir / ".git"
+    if git_path.is_dir():
+        return git_path / "config"
+    if git_path.is_file():
+        # Worktrees/submodules use a ".git" file pointing at the real git dir.
+        text = git_path.read_text(encoding="utf-8", errors="replace").strip()
+        if text.startswith("gitdir:"):
+            git_dir = Path(text[len("gitdir:"):].strip())
+            if not git_dir.is_absolute():
+                git_dir = repo_dir / git_dir
+            # A worktree's gitdir is .git/worktrees/<name>; its config lives in the common dir.
+            commondir_file = git_dir / "commondir"
+            if commondir_file.is_file():
+                common_dir = Path(commondir_file.read_text(encoding="utf-8", errors="replace").strip())
+                if not common_dir.is_absolute():
+                    common_dir = git_dir / common_dir
+                return common_dir / "config"
+            return git_dir / "config"
+        raise ValueError(f"Unrecognised .git file in {repo_dir}")
+    return None
+
+
+def _parse_origin_url(config_text: str):
+    section = ""
+    for raw_line in config_text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            section = line.strip("[]").strip()
+            continue
+        if section != 'remote "origin"' or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        if key.strip().lower() == "url":
+            return value.strip().strip('"')
+    return ""
+
+
+def _git_origin_url(repo_dir: Path):
+    result = subprocess.run(["git", "remote", "get-url", "origin"], cwd=str(repo_dir), capture_output=True,
+                            text=True, timeout=TIMEOUTS["git_remote"], encoding="utf-8", errors="replace")
+    return (result.stdout or "").strip() if result.returncode == 0 else ""
+
+
+def read_origin_url(repo_dir: Path):
+    """Return the origin URL from the repo's git config, spawning git only for layouts it can't read."""
+    try:
+        config_path = _git_config_path(repo_dir)
+        if config_path is None:
+            return ""
+        st = config_path.stat()
+    except (OSError, ValueError) as exc:
+        logger.debug("Reading origin url for %s via git: %s", repo_dir, exc)
+        return _git_origin_url(repo_dir)
+    key = str(config_path)
+    # Size guards against same-tick rewrites on filesystems with coarse mtime (FAT/exFAT).
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = ORIGIN_URL_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    text = config_path.read_text(encoding="utf-8", errors="replace")
+    url = _parse_origin_url(text)
+    if not url and "[include" in text.lower():
+        # The origin may come from an [include]/[includeIf] file; let git resolve it (uncached).
+        return _git_origin_url(repo_dir)
+    ORIGIN_URL_CACHE[key] = (signature, url)
+    return url
+
+
+def _dir_mtime_ns(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
 def get_installed_urls():
+    now = time.time()
+    # Adding/removing a folder in MY_REPOS bumps its mtime, so the cache is
+    # also dropped early when the folder set changes outside the app.
+    key = _dir_mtime_ns(MY_REPOS_DIR)
+    if INSTALLED_URLS_CACHE["expires_at"] > now and INSTALLED_URLS_CACHE["key"] == key:
+        return set(INSTALLED_URLS_CACHE["urls"])
+
     urls = set()
     candidates = []
-    if MY_REPOS_DIR.exists():
-        candidates.extend([entry for entry in MY_REPOS_DIR.iterdir() if entry.is_dir()])
+    candidates.extend(Path(entry.path) for entry in scan_subdirs(MY_REPOS_DIR))
     if (BASE_DIR / ".git").exists():
         candidates.append(BASE_DIR)
 
     for entry in candidates:
         try:
-            r = subprocess.run(["git", "-C", str(entry), "remote", "get-url", "origin"],
-                               capture_output=True, text=True, timeout=5)
-            if r.returncode == 0:
-                url = (r.stdout or "").strip().removesuffix(".git").rstrip("/")
-                urls.add(url)
+            url = read_origin_url(entry)
+            if url:
+                urls.add(url.removesuffix(".git").rstrip("/"))
         except Exception as exc:
             logger.debug("Skipping remote url for %s: %s", entry, exc)
-    return urls
+
+    INSTALLED_URLS_CACHE["urls"] = urls
+    INSTALLED_URLS_CACHE["key"] = key
+    INSTALLED_URLS_CACHE["expires_at"] = now + GIT_STATE_TTL_SEC
+    return set(urls)
 
 
 def get_new_projects(states_by_path=None):
     projects = []
-    if not NEW_PROJECTS_DIR.exists():
-        return projects
-    for entry in NEW_PROJECTS_DIR.iterdir():
-        if entry.is_dir():
-            # If folder is already connected to GitHub, do not show it as local-only.
-            try:
-                resolved_key = str(entry.resolve())
-                if states_by_path and resolved_key in states_by_path:
-                    if states_by_path[resolved_key].get("is_github_remote"):
-                        continue
-                elif (entry / ".git").exists():
-                    r = subprocess.run(["git", "-C", str(entry), "remote", "get-url", "origin"],
-                                       capture_output=True, text=True, timeout=5)
-                    origin = (r.stdout or "").strip().lower()
-                    if r.returncode == 0 and "github.com" in origin:
-                        continue
-            except Exception as exc:
-                logger.debug("Cannot inspect local project remote %s: %s", entry, exc)
-            try:
-                ts = entry.stat().st_ctime
-                created = datetime.fromtimestamp(ts).isoformat() + "Z"
-            except Exception as exc:
-                logger.debug("Cannot read creation time for %s: %s", entry, exc)
-                created = ""
-            projects.append(Project(entry.name, str(entry).replace("\\", "/"),
-                                    False, "", created, True).as_dict())
+    for dir_entry in scan_subdirs(NEW_PROJECTS_DIR):
+        entry = Path(dir_entry.path)
+        # If folder is already connected to GitHub, do not show it as local-only.
+        try:
+            resolved_key = _realpath(str(entry))
+            if states_by_path and resolved_key in states_by_path:
+                if states_by_path[resolved_key].get("is_github_remote"):
+                    continue
+            elif "github.com" in read_origin_url(entry).lower():
+                continue
+        except Exception as exc:
+            logger.debug("Cannot inspect local project remote %s: %s", entry, exc)
+        try:
+            ts = dir_entry.stat().st_ctime
+            created = datetime.fromtimestamp(ts).isoformat() + "Z"
+        except Exception as exc:
+            logger.debug("Cannot read creation time for %s: %s", entry, exc)
+            created = ""
+        projects.append({"name": entry.name, "url": str(entry).replace("\\", "/"),
+                         "private": False, "description": "", "created_at": created,
+                         "is_new_project": True})
     return projects
 
 
@@ -290,130 +474,262 @@ def normalize_repo_url(url: str):
     return str(url or "").strip().rstrip("/").removesuffix(".git").lower()
 
 
-def get_local_git_states(force_refresh=False):
+def _read_git_state(entry: Path):
+    resolved = _realpath(str(entry))
+
+    has_uncommitted = False
+    try:
+        status = subprocess.run(
+            # Only "anything to commit?" matters: skip rename detection and don't recurse into
+            # submodule work trees (their edits can't be committed from this repo anyway).
+            ["git", "--no-optional-locks", "status", "--porcelain", "--no-renames", "--ignore-submodules=dirty"],
+            cwd=str(entry),
+            capture_output=True,
+            text=True,
+            timeout=TIMEOUTS["git_remote"],
+            encoding="utf-8",
+            errors="replace",
+        )
+        if status.returncode == 0 and (status.stdout or "").strip():
+            has_uncommitted = True
+    except Exception as exc:
+        logger.debug("git status failed for %s: %s", entry, exc)
+
+    # Origin comes from the (cached) git config, so each repo costs one git process, not two.
+    remote_url = ""
+    try:
+        remote_url = read_origin_url(entry)
+    except Exception as exc:
+        logger.debug("Cannot read origin url for %s: %s", entry, exc)
+    has_origin = bool(remote_url)
+    remote_norm = normalize_repo_url(remote_url) if has_origin else ""
+
+    state = {
+        "has_uncommitted": has_uncommitted,
+        "has_origin": has_origin,
+        "is_github_remote": ("github.com" in remote_url.lower()) if has_origin else False,
+        "can_push": has_uncommitted and has_origin,
+    }
+    return resolved, state, remote_norm
+
+
+def get_local_git_states(force_refresh=False, max_age=0.0):
     now = time.time()
     if (not force_refresh) and GIT_STATE_CACHE["expires_at"] > now:
         return GIT_STATE_CACHE["by_path"], GIT_STATE_CACHE["by_remote"]
 
+    # Single flight: concurrent polls wait for one scan instead of each forking git for every repo.
+    with GIT_STATE_LOCK:
+        if force_refresh:
+            # A scan that started after this call was made (or, with max_age, at most that many
+            # seconds before it and not invalidated since) is as fresh as a new one.
+            if GIT_STATE_CACHE["started_at"] >= now - max_age and GIT_STATE_CACHE["expires_at"]:
+                return GIT_STATE_CACHE["by_path"], GIT_STATE_CACHE["by_remote"]
+        elif GIT_STATE_CACHE["expires_at"] > time.time():
+            return GIT_STATE_CACHE["by_path"], GIT_STATE_CACHE["by_remote"]
+        elif not GIT_STATE_CACHE["started_at"] and _load_git_state_disk_cache(now):
+            return GIT_STATE_CACHE["by_path"], GIT_STATE_CACHE["by_remote"]
+        # Forced polls (/api/push-states) rescan outside the reuse window; the file only serves
+        # restarts within the TTL, so rewriting it on each poll would be wasted I/O.
+        return _scan_local_git_states(persist=not force_refresh)
+
+
+def _load_git_state_disk_cache(now: float):
+    # A hot-reload restart within the TTL reuses the last scan instead of forking git per repo again.
+    data = _read_json_cache(GIT_STATE_CACHE_FILE)
+    try:
+        ts = float(data.get("ts") or 0)
+        by_path, by_remote = data["by_path"], data["by_remote"]
+    except Exception:
+        return False
+    if not (isinstance(by_path, dict) and isinstance(by_remote, dict)) or not 0 <= now - ts < GIT_STATE_TTL_SEC:
+        return False
+    GIT_STATE_CACHE["by_path"] = by_path
+    GIT_STATE_CACHE["by_remote"] = by_remote
+    GIT_STATE_CACHE["started_at"] = ts
+    GIT_STATE_CACHE["expires_at"] = ts + GIT_STATE_TTL_SEC
+    return True
+
+
+def _scan_local_git_states(persist=True):
+    now = time.time()
+    generation = GIT_STATE_CACHE["generation"]
     states_by_path = {}
     states_by_remote = {}
     candidates = []
     for root in (MY_REPOS_DIR, NEW_PROJECTS_DIR):
-        if not root.exists():
-            continue
-        candidates.extend([entry for entry in root.iterdir() if entry.is_dir() and (entry / ".git").exists()])
+        candidates.extend(Path(entry.path) for entry in scan_subdirs(root)
+                          if os.path.exists(os.path.join(entry.path, ".git")))
     if (BASE_DIR / ".git").exists():
         candidates.append(BASE_DIR)
 
-    for entry in candidates:
-        resolved = str(entry.resolve())
-
-        has_uncommitted = False
-        try:
-            status = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=str(entry),
-                capture_output=True,
-                text=True,
-                timeout=TIMEOUTS["git_remote"],
-                encoding="utf-8",
-                errors="replace",
-            )
-            if status.returncode == 0 and (status.stdout or "").strip():
-                has_uncommitted = True
-        except Exception as exc:
-            logger.debug("git status failed for %s: %s", entry, exc)
-
-        has_origin = False
-        remote_norm = ""
-        remote_url = ""
-        try:
-            remote = subprocess.run(
-                ["git", "remote", "get-url", "origin"],
-                cwd=str(entry),
-                capture_output=True,
-                text=True,
-                timeout=TIMEOUTS["git_remote"],
-                encoding="utf-8",
-                errors="replace",
-            )
-            remote_url = (remote.stdout or "").strip()
-            if remote.returncode == 0 and remote_url:
-                has_origin = True
-                remote_norm = normalize_repo_url(remote_url)
-        except Exception as exc:
-            logger.debug("git remote get-url failed for %s: %s", entry, exc)
-
-        state = {
-            "has_uncommitted": has_uncommitted,
-            "has_origin": has_origin,
-            "is_github_remote": ("github.com" in remote_url.lower()) if has_origin else False,
-            "can_push": has_uncommitted and has_origin,
-        }
+    for resolved, state, remote_norm in GIT_EXECUTOR.map(_read_git_state, candidates):
         states_by_path[resolved] = state
         if remote_norm:
             states_by_remote[remote_norm] = state
 
+    if GIT_STATE_CACHE["generation"] != generation:
+        # Invalidated mid-scan: answer this caller, but let the next one rescan.
+        return states_by_path, states_by_remote
     GIT_STATE_CACHE["by_path"] = states_by_path
     GIT_STATE_CACHE["by_remote"] = states_by_remote
+    GIT_STATE_CACHE["started_at"] = now
     GIT_STATE_CACHE["expires_at"] = now + GIT_STATE_TTL_SEC
+    if persist:
+        _write_json_cache(GIT_STATE_CACHE_FILE, {"ts": now, "by_path": states_by_path, "by_remote": states_by_remote})
+    if GIT_STATE_CACHE["generation"] != generation:
+        # Invalidation raced with the writes above; undo them.
+        GIT_STATE_CACHE["started_at"] = 0.0
+        GIT_STATE_CACHE["expires_at"] = 0.0
+        GIT_STATE_CACHE_FILE.unlink(missing_ok=True)
     return states_by_path, states_by_remote
 
 
+def sort_github_repos(repos):
+    # Profile repo (named after the user) first, then case-insensitive by name.
+    return sorted(repos, key=lambda r: (r.get("name") != GITHUB_USERNAME, str(r.get("name", "")).lower()))
+
+
 def load_github_repos(force_refresh=False, raise_on_error=False):
+    """Return GitHub repos in display order; the list is cached already sorted."""
     now = time.time()
     if (not force_refresh) and GITHUB_REPOS_CACHE["expires_at"] > now:
         return GITHUB_REPOS_CACHE["items"]
 
-    if not GITHUB_USERNAME or GITHUB_USERNAME == "Unknown" or not GITHUB_TOKEN:
-        if raise_on_error:
-            raise RuntimeError("GITHUB_USERNAME and GITHUB_TOKEN are required")
-        logger.warning("GitHub credentials are missing; returning empty repo list")
-        GITHUB_REPOS_CACHE["items"] = []
-        GITHUB_REPOS_CACHE["expires_at"] = now + 10
-        return []
-
-    try:
-        repos = fetch_compact_repos(GITHUB_USERNAME, GITHUB_TOKEN)
-        GITHUB_REPOS_CACHE["items"] = repos
-        GITHUB_REPOS_CACHE["expires_at"] = now + TIMEOUTS["refresh"]
-        return repos
-    except Exception as exc:
-        if raise_on_error:
-            raise
-        logger.warning("Failed to fetch GitHub repos: %s", exc)
-        if GITHUB_REPOS_CACHE["items"]:
+    # Single-flight: concurrent requests wait for one GitHub fetch instead of each paging the API.
+    with GITHUB_REPOS_LOCK:
+        if force_refresh:
+            # A fetch that started after this call was made is as fresh as a new one.
+            if GITHUB_REPOS_CACHE["fetched_at"] >= now:
+                return GITHUB_REPOS_CACHE["items"]
+        elif GITHUB_REPOS_CACHE["expires_at"] > time.time():
             return GITHUB_REPOS_CACHE["items"]
-        return []
+        now = time.time()
+        if not force_refresh:
+            # A hot-reload restart within the TTL reuses the last fetch instead of paging the API again.
+            data = _read_json_cache(GITHUB_REPOS_CACHE_FILE)
+            ts = float(data.get("ts") or 0)
+            if data.get("username") == GITHUB_USERNAME and isinstance(data.get("items"), list) \
+                    and now - ts < TIMEOUTS["refresh"]:
+                GITHUB_REPOS_CACHE["items"] = data["items"]
+                GITHUB_REPOS_CACHE["fetched_at"] = ts
+                GITHUB_REPOS_CACHE["expires_at"] = ts + TIMEOUTS["refresh"]
+                return data["items"]
+
+        if not GITHUB_USERNAME or GITHUB_USERNAME == "Unknown" or not GITHUB_TOKEN:
+            if raise_on_error:
+                raise RuntimeError("GITHUB_USERNAME and GITHUB_TOKEN are required")
+            logger.warning("GitHub credentials are missing; returning empty repo list")
+            GITHUB_REPOS_CACHE["items"] = []
+            GITHUB_REPOS_CACHE["expires_at"] = now + 10
+            return []
+
+        try:
+            repos = sort_github_repos(fetch_compact_repos(GITHUB_USERNAME, GITHUB_TOKEN))
+            GITHUB_REPOS_CACHE["items"] = repos
+            GITHUB_REPOS_CACHE["fetched_at"] = now
+            GITHUB_REPOS_CACHE["expires_at"] = now + TIMEOUTS["refresh"]
+            _write_json_cache(GITHUB_REPOS_CACHE_FILE, {"username": GITHUB_USERNAME, "ts": now, "items": repos})
+            return repos
+        except Exception as exc:
+            if raise_on_error:
+                raise
+            logger.warning("Failed to fetch GitHub repos: %s", exc)
+            if GITHUB_REPOS_CACHE["items"]:
+                return GITHUB_REPOS_CACHE["items"]
+            return []
+
+
+def edit_cached_github_repo(name: str, fields=None, remove=False):
+    """Apply a known GitHub-side change to the cached repo list instead of refetching it.
+
+    Returns False when there is no current cached list; the caller should then invalidate it.
+    """
+    if GITHUB_REPOS_CACHE["expires_at"] <= time.time() or not GITHUB_REPOS_CACHE["fetched_at"]:
+        return False
+    items = GITHUB_REPOS_CACHE["items"]
+    for index, repo in enumerate(items):
+        if repo.get("name") == name:
+            break
+    else:
+        return True
+    if remove:
+        items = items[:index] + items[index + 1:]
+    else:
+        if all(repo.get(key) == value for key, value in fields.items()):
+            return True
+        items = list(items)
+        items[index] = {**repo, **fields}
+    GITHUB_REPOS_CACHE["items"] = items
+    _write_json_cache(GITHUB_REPOS_CACHE_FILE,
+                      {"username": GITHUB_USERNAME, "ts": GITHUB_REPOS_CACHE["fetched_at"], "items": items})
+    return True
+
+
+def get_http_session():
+    # One keep-alive session for all GitHub API calls made by the backend.
+    global HTTP_SESSION
+    if HTTP_SESSION is None:
+        import requests
+        HTTP_SESSION = requests.Session()
+    return HTTP_SESSION
 
 
 def get_avatar():
     if not GITHUB_USERNAME:
         return ""
+    now = time.time()
+    if AVATAR_CACHE["expires_at"] > now:
+        return AVATAR_CACHE["url"]
+
+    # Survive restarts (hot reload restarts the worker on every backend edit).
+    entry = _read_json_cache(AVATAR_CACHE_FILE).get(GITHUB_USERNAME)
+    if isinstance(entry, dict) and entry.get("url"):
+        ts = float(entry.get("ts") or 0)
+        if now - ts < AVATAR_CACHE_TTL_SEC:
+            AVATAR_CACHE["url"] = str(entry["url"])
+            AVATAR_CACHE["expires_at"] = ts + AVATAR_CACHE_TTL_SEC
+            return AVATAR_CACHE["url"]
+
+    url = ""
     try:
-        import requests
         headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-        r = requests.get(f"https://api.github.com/users/{GITHUB_USERNAME}",
-                        headers=headers, timeout=5)
+        r = get_http_session().get(f"https://api.github.com/users/{GITHUB_USERNAME}",
+                                   headers=headers, timeout=5)
         if r.status_code == 200:
-            return r.json().get("avatar_url", "")
+            url = r.json().get("avatar_url", "")
     except Exception as exc:
         logger.debug("Failed to load avatar: %s", exc)
-    return ""
+
+    # Retry failures sooner than successes so a transient outage does not stick for long.
+    AVATAR_CACHE["url"] = url
+    AVATAR_CACHE["expires_at"] = now + (AVATAR_CACHE_TTL_SEC if url else 60)
+    if url:
+        data = _read_json_cache(AVATAR_CACHE_FILE)
+        data[GITHUB_USERNAME] = {"url": url, "ts": now}
+        _write_json_cache(AVATAR_CACHE_FILE, data)
+    return url
 
 
 def count_folders(path: Path):
-    return sum(1 for p in path.iterdir() if p.is_dir()) if path.exists() else 0
+    return len(scan_subdirs(path))
+
+
+SAFE_NAME_RE = re.compile(r"[^/\\\x00]+\Z")
+WINDOWS_RESERVED_NAMES = frozenset(
+    ["CON", "PRN", "AUX", "NUL"]
+    + [f"COM{i}" for i in range(1, 10)]
+    + [f"LPT{i}" for i in range(1, 10)]
+)
 
 
 def safe_name(name):
-    if not name or name.strip() != name:
-        return False
-    p = Path(name)
-    if p.is_absolute() or ".." in p.parts or "." in p.parts or len(p.parts) != 1:
-        return False
-    if sys.platform == "win32" and ":" in name:
+    # Single folder name only: no separators, traversal or NUL bytes.
+    if not name or name.strip() != name or name in (".", "..") or not SAFE_NAME_RE.match(name):
         return False
+    if sys.platform == "win32":
+        if ":" in name or name.split(".", 1)[0].upper() in WINDOWS_RESERVED_NAMES:
+            return False
     return True
 
 
@@ -428,15 +744,60 @@ def repo_name_from_url(repo_url: str):
     return name.strip()
 
 
+# Legacy plain-text output of create_new_project.py (newer versions print JSON).
+CREATED_PROJECT_RE = re.compile(r'Project "([^"]+)" created')
+
 PROJECTS_FACTORY_REPO_URL = "https://github.com/israice/projects-factory"
 PROJECTS_FACTORY_REPO_NAME = repo_name_from_url(PROJECTS_FACTORY_REPO_URL).lower()
 
 
+ALLOWED_PROJECT_ROOTS = (NEW_PROJECTS_DIR.resolve(), MY_REPOS_DIR.resolve(), BASE_DIR.resolve())
+
+
+def get_project_index():
+    """Return (by_name, by_remote) maps of local project folders to their resolved paths."""
+    now = time.time()
+    # Same freshness rule as get_installed_urls: TTL, or earlier when either folder set changes.
+    key = (_dir_mtime_ns(MY_REPOS_DIR), _dir_mtime_ns(NEW_PROJECTS_DIR))
+    if PROJECT_INDEX_CACHE["expires_at"] > now and PROJECT_INDEX_CACHE["key"] == key:
+        return PROJECT_INDEX_CACHE["by_name"], PROJECT_INDEX_CACHE["by_remote"]
+
+    by_name = {}
+    by_remote = {}
+    # NEW_PROJECTS first so a MY_REPOS folder with the same name wins, as in the fallback lookup.
+    for root in (NEW_PROJECTS_DIR, MY_REPOS_DIR):
+        for entry in scan_subdirs(root):
+            resolved = Path(_realpath(entry.path))
+            by_name[entry.name] = resolved
+            try:
+                remote = normalize_repo_url(read_origin_url(Path(entry.path)))
+            except Exception as exc:
+                logger.debug("Skipping remote url for %s: %s", entry.path, exc)
+                continue
+            if remote:
+                by_remote[remote] = resolved
+
+    PROJECT_INDEX_CACHE["by_name"] = by_name
+    PROJECT_INDEX_CACHE["by_remote"] = by_remote
+    PROJECT_INDEX_CACHE["resolved"] = {}
+    PROJECT_INDEX_CACHE["key"] = key
+    PROJECT_INDEX_CACHE["expires_at"] = now + GIT_STATE_TTL_SEC
+    return by_name, by_remote
+
+
 def resolve_project_path(raw_path: str):
     raw = str(raw_path or "").strip()
     if not raw:
         return None
+    by_name, by_remote = get_project_index()
+    # A UI burst (screenshots, open, push) resolves the same path repeatedly.
+    memo = PROJECT_INDEX_CACHE["resolved"]
+    if raw not in memo:
+        memo[raw] = _resolve_project_path(raw, by_name, by_remote)
+    return memo[raw]
+
 
+def _resolve_project_path(raw: str, by_name, by_remote):
     resolved = None
     direct = Path(raw).expanduser()
     if direct.exists() and direct.is_dir():
@@ -453,7 +814,10 @@ def resolve_project_path(raw_path: str):
             guessed_name = repo_name_from_url(raw)
             if not guessed_name:
                 guessed_name = Path(raw).name.strip()
-            if guessed_name:
+            indexed = by_name.get(guessed_name) or by_remote.get(normalized_raw)
+            if indexed:
+                resolved = indexed
+            elif guessed_name:
                 guessed = (MY_REPOS_DIR / guessed_name).resolve()
                 if guessed.exists() and guessed.is_dir():
                     resolved = guessed
@@ -469,8 +833,7 @@ def resolve_project_path(raw_path: str):
     if not resolved:
         return None
 
-    allowed_roots = (NEW_PROJECTS_DIR.resolve(), MY_REPOS_DIR.resolve(), BASE_DIR.resolve())
-    if not any(resolved == root or root in resolved.parents for root in allowed_roots):
+    if not any(resolved == root or root in resolved.parents for root in ALLOWED_PROJECT_ROOTS):
         return None
     return resolved
 
@@ -550,22 +913,28 @@ def _force_foreground_window(hwnd: int):
             user32.AttachThreadInput(fg_tid, cur_tid, False)
 
 
+EXPLORER_WAIT_SEC = 4.0
+EXPLORER_POLL_MIN_SEC = 0.02
+EXPLORER_POLL_MAX_SEC = 0.25
+
+
 def open_folder_in_explorer(path: Path):
     if os.name == "nt":
         import ctypes
 
         user32 = ctypes.WinDLL("user32", use_last_error=True)
         before = set(_list_windows_explorer_handles())
-        subprocess.Popen(
-            ["cmd", "/c", "start", "", "explorer", str(path)],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        foreground_before = int(user32.GetForegroundWindow() or 0)
+        # ShellExecuteW directly; no cmd.exe/explorer.exe launcher processes.
+        os.startfile(str(path))
 
         selected = None
-        deadline = time.time() + 4.0
+        deadline = time.time() + EXPLORER_WAIT_SEC
+        delay = EXPLORER_POLL_MIN_SEC
         while time.time() < deadline:
-            time.sleep(0.05)
+            # Back off between EnumWindows passes; a new window usually shows up within the first few.
+            time.sleep(delay)
+            delay = min(delay * 2, EXPLORER_POLL_MAX_SEC)
             current = _list_windows_explorer_handles()
             new_handles = [hwnd for hwnd in current if hwnd not in before]
             if new_handles:
@@ -573,6 +942,11 @@ def open_folder_in_explorer(path: Path):
                 break
             if current:
                 selected = current[-1]
+                # Explorer reused an already open window for this folder and activated it.
+                foreground = int(user32.GetForegroundWindow() or 0)
+                if foreground != foreground_before and foreground in current:
+                    selected = foreground
+                    break
 
         if not selected:
             selected = int(user32.GetForegroundWindow() or 0) or None
@@ -580,11 +954,8 @@ def open_folder_in_explorer(path: Path):
             _force_foreground_window(selected)
         return
 
-    if sys.platform == "darwin":
-        run_command(["open", str(path)], timeout=30)
-        return
-
-    run_command(["xdg-open", str(path)], timeout=30)
+    opener = "open" if sys.platform == "darwin" else "xdg-open"
+    subprocess.Popen([opener, str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
 
 def _is_loopback_host(host: str):
@@ -604,54 +975,71 @@ def require_write_access(request: Request):
         raise HTTPException(403, "Write access is limited to local requests")
 
 
+NO_STORE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+# frontend file name -> ((st_mtime_ns, st_size), bytes, etag, checked_at); the assets are small,
+# so keep them in memory and only re-stat once per FRONTEND_RECHECK_SEC to pick up edits.
+FRONTEND_FILE_CACHE = {}
+FRONTEND_RECHECK_SEC = 1.0
+
+
+def frontend_file(request: Request, name: str, media_type: str | None = None):
+    now = time.monotonic()
+    cached = FRONTEND_FILE_CACHE.get(name)
+    if not cached or now - cached[3] >= FRONTEND_RECHECK_SEC:
+        path = FRONTEND_DIR / name
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        if cached and cached[0] == signature:
+            cached = (*cached[:3], now)
+        else:
+            cached = (signature, path.read_bytes(), f'"{st.st_mtime_ns:x}-{st.st_size:x}"', now)
+        FRONTEND_FILE_CACHE[name] = cached
+    _, data, etag, _ = cached
+    media_type = media_type or mimetypes.guess_type(name)[0]
+    if DEV_NO_CACHE:
+        return Response(data, media_type=media_type, headers=NO_STORE_HEADERS)
+    # URLs are not versioned, so browsers must revalidate ("no-cache"), but an unchanged
+    # file costs a 304 instead of a full download.
+    headers = {"Cache-Control": "no-cache", "ETag": etag}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return Response(data, media_type=media_type, headers=headers)
+
+
 @app.get("/")
-async def index():
-    return FileResponse(str(FRONTEND_DIR / "index.html"), headers={
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    })
+async def index(request: Request):
+    return frontend_file(request, "index.html")
 
 
 @app.get("/app.js")
-async def app_js():
-    return FileResponse(str(FRONTEND_DIR / "app.js"), media_type="application/javascript", headers={
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    })
+async def app_js(request: Request):
+    return frontend_file(request, "app.js", "application/javascript")
 
 
 @app.get("/ui.templates.js")
-async def ui_templates_js():
-    return FileResponse(str(FRONTEND_DIR / "ui.templates.js"), media_type="application/javascript", headers={
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    })
+async def ui_templates_js(request: Request):
+    return frontend_file(request, "ui.templates.js", "application/javascript")
 
 
 @app.get("/app.css")
-async def app_css():
-    return FileResponse(str(FRONTEND_DIR / "app.css"), media_type="text/css", headers={
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    })
+async def app_css(request: Request):
+    return frontend_file(request, "app.css", "text/css")
 
 
 @app.get("/app.template.html")
-async def app_template():
-    return FileResponse(str(FRONTEND_DIR / "app.template.html"), media_type="text/html", headers={
-        "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
-        "Pragma": "no-cache",
-        "Expires": "0",
-    })
+async def app_template(request: Request):
+    return frontend_file(request, "app.template.html", "text/html")
 
 
 @app.get("/favicon.ico")
-async def favicon():
-    return FileResponse(str(FRONTEND_DIR / "favicon.svg"), media_type="image/svg+xml")
+async def favicon(request: Request):
+    return frontend_file(request, "favicon.svg", "image/svg+xml")
 
 
 @app.get("/.well-known/appspecific/com.chrome.devtools.json", include_in_schema=False)
@@ -662,91 +1050,91 @@ async def chrome_devtools_probe():
 
 @app.get("/api/config")
 async def config():
-    installed_urls = list(get_installed_urls())
-    return {"username": GITHUB_USERNAME, "avatar_url": get_avatar(),
+    # Both helpers block (disk scan, GitHub HTTP on cache miss); run them side by side off the loop.
+    installed, avatar_url = await asyncio.gather(asyncio.to_thread(get_installed_urls),
+                                                 asyncio.to_thread(get_avatar))
+    installed_urls = list(installed)
+    return {"username": GITHUB_USERNAME, "avatar_url": avatar_url,
             "installed_count": len(installed_urls),
             "installed_urls": installed_urls}
 
 
-@app.get("/api/repos")
-async def repos():
-    github_repos = load_github_repos()
-    sorted_repos = sorted(github_repos, key=lambda r: (r.get("name") != GITHUB_USERNAME,
-                                                        str(r.get("name", "")).lower()))
-    states_by_path, states_by_remote = get_local_git_states()
+def _can_push(local_path, url, states_by_path, states_by_remote):
+    local_state = states_by_path.get(_realpath(str(local_path))) if local_path else None
+    if local_state and local_state.get("can_push"):
+        return True
+    remote_state = states_by_remote.get(normalize_repo_url(url)) if url else None
+    return bool(remote_state and remote_state.get("can_push"))
 
-    enriched_github = []
-    for repo in sorted_repos:
-        enriched = dict(repo)
-        can_push = False
-        name = str(enriched.get("name", "")).strip()
-        if name:
-            local_path = MY_REPOS_DIR / name
-            local_state = states_by_path.get(str(local_path.resolve()))
-            if local_state:
-                can_push = bool(local_state.get("can_push"))
-        if not can_push:
-            remote_state = states_by_remote.get(normalize_repo_url(enriched.get("url", "")))
-            if remote_state:
-                can_push = bool(remote_state.get("can_push"))
-        enriched["can_push"] = can_push
-        enriched_github.append(enriched)
-
-    enriched_new = []
-    for repo in get_new_projects(states_by_path):
-        enriched = dict(repo)
-        can_push = False
-        raw_path = str(enriched.get("url", "")).strip()
-        if raw_path:
-            try:
-                local_state = states_by_path.get(str(Path(raw_path).resolve()))
-                if local_state:
-                    can_push = bool(local_state.get("can_push"))
-            except Exception as exc:
-                logger.debug("Cannot resolve local path for can_push: %s", exc)
-        enriched["can_push"] = can_push
-        enriched_new.append(enriched)
 
-    return {"repos": enriched_github + enriched_new, "count": len(sorted_repos)}
+def _local_can_push(raw_path, states_by_path):
+    if not raw_path:
+        return False
+    try:
+        local_state = states_by_path.get(_realpath(raw_path))
+    except Exception as exc:
+        logger.debug("Cannot resolve local path for can_push: %s", exc)
+        return False
+    return bool(local_state and local_state.get("can_push"))
 
 
-@app.get("/api/push-states")
-async def push_states():
-    github_repos = load_github_repos()
-    sorted_repos = sorted(github_repos, key=lambda r: (r.get("name") != GITHUB_USERNAME,
-                                                        str(r.get("name", "")).lower()))
-    states_by_path, states_by_remote = get_local_git_states(force_refresh=True)
-
+def _repos_payload(sorted_repos, new_projects, states_by_path, states_by_remote):
+    enriched = []
+    for repo in sorted_repos:
+        name = str(repo.get("name", "")).strip()
+        item = dict(repo)
+        item["can_push"] = _can_push(MY_REPOS_DIR / name if name else None, item.get("url", ""),
+                                     states_by_path, states_by_remote)
+        enriched.append(item)
+    for repo in new_projects:
+        item = dict(repo)
+        item["can_push"] = _local_can_push(str(item.get("url", "")).strip(), states_by_path)
+        enriched.append(item)
+    return {"repos": enriched, "count": len(sorted_repos)}
+
+
+def _push_state_items(sorted_repos, new_projects, states_by_path, states_by_remote):
     items = []
-
     for repo in sorted_repos:
         name = str(repo.get("name", "")).strip()
         url = str(repo.get("url", "")).strip()
-        can_push = False
+        preferred_local = None
         if name:
             preferred_local = BASE_DIR if BASE_DIR.name == name else (MY_REPOS_DIR / name)
-            local_state = states_by_path.get(str(preferred_local.resolve()))
-            if local_state:
-                can_push = bool(local_state.get("can_push"))
-        if not can_push:
-            remote_state = states_by_remote.get(normalize_repo_url(url))
-            if remote_state:
-                can_push = bool(remote_state.get("can_push"))
-        items.append({"name": name, "url": url, "can_push": can_push})
-
-    for repo in get_new_projects(states_by_path):
+        items.append({"name": name, "url": url,
+                      "can_push": _can_push(preferred_local, url, states_by_path, states_by_remote)})
+    for repo in new_projects:
         url = str(repo.get("url", "")).strip()
-        can_push = False
-        if url:
-            try:
-                local_state = states_by_path.get(str(Path(url).resolve()))
-                if local_state:
-                    can_push = bool(local_state.get("can_push"))
-            except Exception as exc:
-                logger.debug("Cannot resolve local path for push state: %s", exc)
-        items.append({"name": str(repo.get("name", "")).strip(), "url": url, "can_push": can_push})
+        items.append({"name": str(repo.get("name", "")).strip(), "url": url,
+                      "can_push": _local_can_push(url, states_by_path)})
+    return items
+
+
+def _local_states_and_new_projects(force_refresh=False, max_age=0.0):
+    states_by_path, states_by_remote = get_local_git_states(force_refresh=force_refresh, max_age=max_age)
+    return states_by_path, states_by_remote, get_new_projects(states_by_path)
 
-    return {"items": items}
+
+async def _load_repos_and_states(force_refresh=False, max_age=0.0):
+    # GitHub fetch and local git probes (including the new-projects listing, which reads
+    # .git/config and may run git) are blocking work; keep them off the event loop.
+    return await asyncio.gather(
+        asyncio.to_thread(load_github_repos),
+        asyncio.to_thread(_local_states_and_new_projects, force_refresh=force_refresh, max_age=max_age))
+
+
+@app.get("/api/repos")
+async def repos():
+    sorted_repos, (states_by_path, states_by_remote, new_projects) = await _load_repos_and_states()
+    # Payload is plain dicts/strings; returning a Response skips FastAPI's jsonable_encoder walk.
+    return JSONResponse(_repos_payload(sorted_repos, new_projects, states_by_path, states_by_remote))
+
+
+@app.get("/api/push-states")
+async def push_states():
+    sorted_repos, (states_by_path, states_by_remote, new_projects) = await _load_repos_and_states(
+        force_refresh=True, max_age=PUSH_STATES_REUSE_SEC)
+    return JSONResponse({"items": _push_state_items(sorted_repos, new_projects, states_by_path, states_by_remote)})
 
 
 @app.get("/api/project-screenshots")
@@ -756,16 +1144,14 @@ async def project_screenshots(path: str = ""):
         return {"items": []}
 
     screenshots_dir = get_project_screenshots_dir(resolved)
-    if not screenshots_dir.exists() or not screenshots_dir.is_dir():
+    try:
+        with os.scandir(screenshots_dir) as it:
+            names = [entry.name for entry in it if image_media_type(entry.name) and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return {"items": []}
 
-    items = []
-    for file_path in sorted(screenshots_dir.iterdir(), key=lambda p: p.name.lower()):
-        if not is_image_file(file_path):
-            continue
-        src = f"/api/project-screenshot-file?path={quote(str(resolved))}&name={quote(file_path.name)}"
-        items.append({"name": file_path.name, "src": src})
-    return {"items": items}
+    prefix = f"/api/project-screenshot-file?path={quote(str(resolved))}&name="
+    return {"items": [{"name": name, "src": prefix + quote(name)} for name in sorted(names, key=str.lower)]}
 
 
 @app.get("/api/project-screenshot-file")
@@ -777,15 +1163,26 @@ async def project_screenshot_file(path: str = "", name: str = ""):
     if not file_name:
         raise HTTPException(400, "Missing image name")
 
-    screenshots_dir = get_project_screenshots_dir(resolved)
-    candidate = (screenshots_dir / file_name).resolve()
-    if screenshots_dir.resolve() not in candidate.parents:
+    # The listing is flat, so a plain file name is all a valid request can carry. Only
+    # separators, NUL and traversal are refused here; reserved stems like "aux.png" are
+    # real files the listing can return, and the containment check below covers the rest.
+    if file_name in (".", "..") or not SAFE_NAME_RE.match(file_name):
+        raise HTTPException(400, "Invalid image path")
+    base = _realpath(str(get_project_screenshots_dir(resolved)))
+    candidate = os.path.realpath(os.path.join(base, file_name))
+    # Only a symlink can still point elsewhere; its target must live in the same folder.
+    if os.path.dirname(candidate) != base:
         raise HTTPException(400, "Invalid image path")
-    if not candidate.exists() or not is_image_file(candidate):
+    media_type = image_media_type(os.path.basename(candidate))
+    try:
+        st = os.stat(candidate) if media_type else None
+    except OSError:
+        st = None
+    if st is None or not S_ISREG(st.st_mode):
         raise HTTPException(404, "Image not found")
 
-    media_type, _ = mimetypes.guess_type(str(candidate))
-    return FileResponse(str(candidate), media_type=media_type or "application/octet-stream")
+    # Hand over the stat we already have so FileResponse does not stat the file again.
+    return FileResponse(candidate, media_type=media_type, stat_result=st)
 
 
 @app.post("/api/refresh")
@@ -793,7 +1190,7 @@ async def refresh(request: Request):
     require_write_access(request)
     try:
         invalidate_runtime_caches()
-        load_github_repos(force_refresh=True, raise_on_error=True)
+        await asyncio.to_thread(load_github_repos, force_refresh=True, raise_on_error=True)
         return {"success": True, "message": "✅ Repositories refreshed"}
     except Exception as e:
         raise HTTPException(500, str(e))
@@ -805,7 +1202,7 @@ async def create_project(request: Request):
     try:
         script = ensure_create_project_script()
         NEW_PROJECTS_DIR.mkdir(parents=True, exist_ok=True)
-        result = run_script(script, timeout=TIMEOUTS["create_project"], cwd=NEW_PROJECTS_DIR)
+        result = await run_script_async(script, timeout=TIMEOUTS["create_project"], cwd=NEW_PROJECTS_DIR)
         output = (result.stdout or "").strip()
         folder = ""
         try:
@@ -814,18 +1211,19 @@ async def create_project(request: Request):
                 folder = data.get("folder_name", "")
         except Exception as exc:
             logger.debug("create-project script output is not JSON: %s", exc)
-            if 'Project "' in output and '" created' in output:
-                folder = output.split('Project "')[1].split('" created')[0]
+            match = CREATED_PROJECT_RE.search(output)
+            if match:
+                folder = match.group(1)
         folder = str(folder or "").strip()
         folder_path = ""
         if folder and safe_name(folder):
             created_dir = NEW_PROJECTS_DIR / folder
             legacy_dir = BASE_DIR / folder
             if not created_dir.exists() and legacy_dir.exists() and legacy_dir.is_dir():
-                shutil.move(str(legacy_dir), str(created_dir))
+                await asyncio.to_thread(shutil.move, str(legacy_dir), str(created_dir))
             if created_dir.exists() and created_dir.is_dir():
                 folder_path = str(created_dir).replace("\\", "/")
-        invalidate_runtime_caches()
+        invalidate_runtime_caches(github=False)
         return {"success": True, "message": f'Project "{folder}" created' if folder else "Project created",
                 "folder_name": folder, "folder_path": folder_path}
     except Exception as e:
@@ -853,7 +1251,7 @@ async def add_to_github(payload: AddToGithubPayload, request: Request):
         raise HTTPException(409, f"Folder '{name}' already exists in MY_REPOS")
     source_project_path: Path = source_path
 
-    commit_date = datetime.now().strftime("%d.%m.%Y")
+    commit_date = time.strftime("%d.%m.%Y")
     commit_message = f"v0.0.1 - {name} started {commit_date}"
     repo_slug = f"{GITHUB_USERNAME}/{name}" if GITHUB_USERNAME and GITHUB_USERNAME != "Unknown" else name
 
@@ -862,15 +1260,20 @@ async def add_to_github(payload: AddToGithubPayload, request: Request):
         moved = False
         try:
             source_project_path.rename(target_path)
-        except OSError:
-            shutil.move(str(source_project_path), str(target_path))
+        except OSError as exc:
+            # Only a cross-volume move needs the copy+delete fallback; a locked file on the same
+            # volume would make shutil.move copy everything and then fail half way through.
+            if exc.errno != errno.EXDEV:
+                raise
+            await asyncio.to_thread(shutil.move, str(source_project_path), str(target_path))
         moved = True
 
         project_path = target_path
         if not (project_path / ".git").exists():
-            run_command(["git", "init"], cwd=project_path, timeout=20)
-        run_command(["git", "add", "."], cwd=project_path, timeout=60)
-        run_command(["git", "commit", "--allow-empty", "-m", commit_message], cwd=project_path, timeout=60)
+            await run_command_async(["git", "init"], cwd=project_path, timeout=20)
+        await run_command_async(["git", "add", "."], cwd=project_path, timeout=60)
+        await run_command_async(["git", "commit", "--allow-empty", "-m", commit_message],
+                                cwd=project_path, timeout=60)
 
         visibility_flag = "--private" if visibility == "private" else "--public"
         gh_cmd = [
@@ -878,7 +1281,7 @@ async def add_to_github(payload: AddToGithubPayload, request: Request):
             "--description", description or "",
             "--source", ".", "--remote", "origin", "--push",
         ]
-        run_command(gh_cmd, cwd=project_path, timeout=120)
+        await run_command_async(gh_cmd, cwd=project_path, timeout=120)
 
         invalidate_runtime_caches()
         return {
@@ -910,10 +1313,15 @@ async def install(payload: InstallPayload, request: Request):
     if not urls:
         raise HTTPException(400, "No repositories selected")
     try:
-        run_script(BACKEND_DIR / "install_existing_repo.py", [str(u) for u in urls],
-                   timeout=TIMEOUTS["install_per_repo"] * len(urls))
-        invalidate_runtime_caches()
+        args, input_text = script_list_args(urls)
+        if SHALLOW_CLONES:
+            args = ["--shallow", *args]
+        await run_script_async(BACKEND_DIR / "install_existing_repo.py", args,
+                               timeout=TIMEOUTS["install_per_repo"] * len(urls), input_text=input_text)
+        invalidate_runtime_caches(github=False)
         return {"success": True, "installed_count": count_folders(MY_REPOS_DIR)}
+    except subprocess.TimeoutExpired:
+        raise HTTPException(504, "Install timed out")
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -925,11 +1333,14 @@ async def delete(payload: DeletePayload, request: Request):
     if not names:
         raise HTTPException(400, "No repositories selected")
     try:
-        run_script(BACKEND_DIR / "delete_local_folder.py", [str(n) for n in names],
-                   timeout=TIMEOUTS["delete_per_repo"] * len(names))
-        invalidate_runtime_caches()
+        args, input_text = script_list_args(names)
+        await run_script_async(BACKEND_DIR / "delete_local_folder.py", args,
+                               timeout=TIMEOUTS["delete_per_repo"] * len(names), input_text=input_text)
+        invalidate_runtime_caches(github=False)
         return {"success": True, "installed_count": count_folders(MY_REPOS_DIR),
                 "new_projects_count": count_folders(NEW_PROJECTS_DIR)}
+    except subprocess.TimeoutExpired:
+        raise HTTPException(504, "Delete timed out")
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -947,7 +1358,7 @@ async def rename_local(payload: RenamePayload, request: Request):
     if new_path.exists():
         raise HTTPException(400, f"Folder '{new}' already exists")
     old_path.rename(new_path)
-    invalidate_runtime_caches()
+    invalidate_runtime_caches(github=False)
     return {"success": True, "old_name": old, "new_name": new}
 
 
@@ -958,10 +1369,12 @@ async def rename_github(payload: RenamePayload, request: Request):
     if not old or not new:
         raise HTTPException(400, "Invalid names")
     try:
-        result = run_script(BACKEND_DIR / "rename_github_repo.py", [old, new],
-                           timeout=TIMEOUTS["rename"])
+        result = await run_script_async(BACKEND_DIR / "rename_github_repo.py", [old, new],
+                                        timeout=TIMEOUTS["rename"])
         invalidate_runtime_caches()
         return {"success": True, "old_name": old, "new_name": new, "output": result.stdout}
+    except subprocess.TimeoutExpired:
+        raise HTTPException(504, "Rename timed out")
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -976,14 +1389,13 @@ async def delete_github(payload: DeleteGithubPayload, request: Request):
         raise HTTPException(500, "GITHUB_TOKEN is not configured")
 
     try:
-        import requests
         api_url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{name}"
         headers = {
             "Authorization": f"Bearer {GITHUB_TOKEN}",
             "Accept": "application/vnd.github+json",
             "User-Agent": "projects-factory/github-delete",
         }
-        r = requests.delete(api_url, headers=headers, timeout=30)
+        r = await asyncio.to_thread(get_http_session().delete, api_url, headers=headers, timeout=30)
         if r.status_code not in (204,):
             detail = ""
             try:
@@ -993,7 +1405,8 @@ async def delete_github(payload: DeleteGithubPayload, request: Request):
                 detail = r.text
             raise HTTPException(500, f"GitHub API error {r.status_code}: {detail[:200]}")
 
-        invalidate_runtime_caches()
+        cache_updated = edit_cached_github_repo(name, remove=True)
+        invalidate_runtime_caches(github=not cache_updated)
         return {"success": True, "name": name}
     except HTTPException:
         raise
@@ -1012,14 +1425,14 @@ async def update_description(payload: UpdateDescriptionPayload, request: Request
         raise HTTPException(500, "GITHUB_TOKEN is not configured")
 
     try:
-        import requests
         api_url = f"https://api.github.com/repos/{GITHUB_USERNAME}/{name}"
         headers = {
             "Authorization": f"Bearer {GITHUB_TOKEN}",
             "Accept": "application/vnd.github+json",
             "User-Agent": "projects-factory/description-update",
         }
-        r = requests.patch(api_url, json={"description": description}, headers=headers, timeout=30)
+        r = await asyncio.to_thread(get_http_session().patch, api_url, json={"description": description},
+                                    headers=headers, timeout=30)
         if r.status_code != 200:
             detail = ""
             try:
@@ -1029,7 +1442,8 @@ async def update_description(payload: UpdateDescriptionPayload, request: Request
                 detail = r.text
             raise HTTPException(500, f"GitHub API error {r.status_code}: {detail[:200]}")
 
-        invalidate_runtime_caches()
+        cache_updated = edit_cached_github_repo(name, {"description": description or ""})
+        invalidate_runtime_caches(github=not cache_updated)
         return {"success": True, "name": name, "description": description}
     except HTTPException:
         raise
@@ -1046,7 +1460,7 @@ async def open_folder(payload: OpenFolderPayload, request: Request):
         raise HTTPException(404, "Folder not found")
 
     try:
-        run_script(BACKEND_DIR / "open_in_vscode.py", [str(resolved)], timeout=30)
+        await run_script_async(BACKEND_DIR / "open_in_vscode.py", [str(resolved)], timeout=30)
     except Exception as e:
         raise HTTPException(500, str(e))
     return {"success": True, "path": str(resolved)}
@@ -1061,7 +1475,8 @@ async def open_folder_explorer(payload: OpenFolderPayload, request: Request):
         raise HTTPException(404, "Folder not found")
 
     try:
-        open_folder_in_explorer(resolved)
+        # The Windows path polls for the new explorer window for up to a few seconds.
+        await asyncio.to_thread(open_folder_in_explorer, resolved)
     except Exception as e:
         raise HTTPException(500, str(e))
     return {"success": True, "path": str(resolved)}
@@ -1084,7 +1499,7 @@ async def push_repo(payload: PushPayload, request: Request):
             raise HTTPException(400, "Invalid version_mode")
 
         if version_mode == "generate_version":
-            version_result = run_script(
+            version_result = await run_script_async(
                 BACKEND_DIR / "create_new_version.py",
                 [str(resolved)],
                 timeout=30,
@@ -1098,23 +1513,33 @@ async def push_repo(payload: PushPayload, request: Request):
             if not commit_message:
                 raise HTTPException(400, "VERSION.md has no version lines. Select 'Generate Version' and try again.")
 
-        run_command(["git", "add", "."], cwd=resolved, timeout=TIMEOUTS["git_push"])
-        try:
-            run_command(["git", "commit", "-m", commit_message], cwd=resolved, timeout=TIMEOUTS["git_push"])
-        except Exception as e:
-            msg = str(e).lower()
-            if "nothing to commit" not in msg and "no changes added to commit" not in msg:
-                raise
-        branch_result = run_command(["git", "branch", "--show-current"], cwd=resolved, timeout=10)
+        git_timeout = TIMEOUTS["git_push"]
+        # -unormal: a user's status.showUntrackedFiles=no must not hide new files from this check.
+        status_result = await run_command_async(
+            ["git", "--no-optional-locks", "status", "--porcelain", "--untracked-files=normal"],
+            cwd=resolved, timeout=git_timeout)
+        changes = (status_result.stdout or "").splitlines()
+        # Clean tree: nothing to stage or commit, just push. Without untracked files,
+        # `add -u` stages the same changes as `add .` without walking for new files.
+        if changes:
+            add_args = ["."] if any(line.startswith("??") for line in changes) else ["-u"]
+            await run_command_async(["git", "add", *add_args], cwd=resolved, timeout=git_timeout)
+            try:
+                await run_command_async(["git", "commit", "-m", commit_message], cwd=resolved, timeout=git_timeout)
+            except Exception as e:
+                msg = str(e).lower()
+                if "nothing to commit" not in msg and "no changes added to commit" not in msg:
+                    raise
+        branch_result = await run_command_async(["git", "branch", "--show-current"], cwd=resolved, timeout=10)
         branch = (branch_result.stdout or "").strip() or "master"
         try:
-            run_command(["git", "push", "origin", branch], cwd=resolved, timeout=TIMEOUTS["git_push"])
+            await run_command_async(["git", "push", "origin", branch], cwd=resolved, timeout=git_timeout)
         except Exception as push_error:
             if not is_non_fast_forward_error(str(push_error)):
                 raise
-            run_command(["git", "pull", "--rebase", "origin", branch], cwd=resolved, timeout=TIMEOUTS["git_push"])
-            run_command(["git", "push", "origin", branch], cwd=resolved, timeout=TIMEOUTS["git_push"])
-        invalidate_runtime_caches()
+            await run_command_async(["git", "pull", "--rebase", "origin", branch], cwd=resolved, timeout=git_timeout)
+            await run_command_async(["git", "push", "origin", branch], cwd=resolved, timeout=git_timeout)
+        invalidate_runtime_caches(github=False)
         return {"success": True, "path": str(resolved), "message": commit_message}
     except Exception as e:
         raise HTTPException(500, str(e))
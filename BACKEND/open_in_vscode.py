@@ -8,13 +8,21 @@ Usage:
 
 from __future__ import annotations
 
+import json
 import subprocess
 import sys
 import shutil
 import os
+import threading
 import time
+from collections import deque
 from pathlib import Path
 
+# code command path -> [st_mtime_ns, st_size] of a binary that last passed `code --version`
+VERIFIED_CMD_CACHE_FILE = Path(__file__).resolve().parent / ".vscode_cmd_cache.json"
+WINGET_TIMEOUT_SEC = 900
+WINGET_TAIL_LINES = 20
+
 
 def find_code_command() -> str | None:
     # 1) Prefer Microsoft VS Code explicit install paths
@@ -37,9 +45,39 @@ def find_code_command() -> str | None:
     return None
 
 
+def _cmd_signature(code_cmd: str) -> list[int] | None:
+    try:
+        st = os.stat(code_cmd)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _read_verified_cache() -> dict:
+    try:
+        data = json.loads(VERIFIED_CMD_CACHE_FILE.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_verified_cache(code_cmd: str, signature: list[int]) -> None:
+    tmp = VERIFIED_CMD_CACHE_FILE.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps({code_cmd: signature}), encoding="utf-8")
+        os.replace(tmp, VERIFIED_CMD_CACHE_FILE)
+    except Exception:
+        pass
+
+
 def vscode_version_ok(code_cmd: str | None) -> bool:
     if not code_cmd:
         return False
+    # This script runs once per "open" click; skip `code --version` while the file that
+    # passed it last time is still in place, unchanged.
+    signature = _cmd_signature(code_cmd)
+    if signature and _read_verified_cache().get(code_cmd) == signature:
+        return True
     try:
         creationflags = 0
         if sys.platform == "win32":
@@ -55,9 +93,13 @@ def vscode_version_ok(code_cmd: str | None) -> bool:
             timeout=20,
             creationflags=creationflags,
         )
-        return r.returncode == 0
+        if r.returncode != 0:
+            return False
     except Exception:
         return False
+    if signature:
+        _write_verified_cache(code_cmd, signature)
+    return True
 
 
 def install_vscode_windows() -> tuple[bool, str]:
@@ -65,7 +107,7 @@ def install_vscode_windows() -> tuple[bool, str]:
     if not winget:
         return False, "winget not found; cannot auto-install VS Code"
     try:
-        r = subprocess.run(
+        proc = subprocess.Popen(
             [
                 winget,
                 "install",
@@ -75,18 +117,35 @@ def install_vscode_windows() -> tuple[bool, str]:
                 "--accept-package-agreements",
                 "--accept-source-agreements",
             ],
-            check=False,
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=900,
+            errors="replace",
+            bufsize=1,
         )
-        if r.returncode == 0:
-            return True, ""
-        detail = (r.stderr or r.stdout or "").strip()
-        return False, detail[:400]
     except Exception as e:
         return False, str(e)
 
+    # winget redraws progress bars for minutes; keep only the tail that can end up in the error.
+    tail: deque[str] = deque(maxlen=WINGET_TAIL_LINES)
+    watchdog = threading.Timer(WINGET_TIMEOUT_SEC, proc.kill)
+    watchdog.start()
+    try:
+        with proc:
+            for line in proc.stdout:
+                line = line.strip()
+                if line:
+                    tail.append(line)
+    finally:
+        timed_out = watchdog.finished.is_set()
+        watchdog.cancel()
+    if proc.returncode == 0:
+        return True, ""
+    if timed_out:
+        return False, f"winget install timed out after {WINGET_TIMEOUT_SEC} seconds"
+    return False, "\n".join(tail)[-400:]
+
 
 def ensure_vscode_command() -> tuple[str | None, str]:
     cmd = find_code_command()
@@ -107,8 +166,55 @@ def ensure_vscode_command() -> tuple[str | None, str]:
     return cmd, ""
 
 
-def _list_windows_for_pid(pid: int) -> list[int]:
+CODE_IMAGE_NAMES = {"code.exe", "code - insiders.exe"}
+WINDOW_WAIT_SEC = 4.0
+WINDOW_POLL_MIN_SEC = 0.02
+WINDOW_POLL_MAX_SEC = 0.25
+
+
+def _code_process_ids() -> set[int]:
+    """Return PIDs of running VS Code processes from one Toolhelp snapshot (no tasklist.exe)."""
     if sys.platform != "win32":
+        return set()
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    th32cs_snapprocess = 0x00000002
+    snapshot = kernel32.CreateToolhelp32Snapshot(th32cs_snapprocess, 0)
+    if not snapshot or snapshot == wintypes.HANDLE(-1).value:
+        return set()
+    pids: set[int] = set()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            if entry.szExeFile.lower() in CODE_IMAGE_NAMES:
+                pids.add(int(entry.th32ProcessID))
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return pids
+
+
+def _list_windows_for_pids(pids: set[int]) -> list[int]:
+    if sys.platform != "win32" or not pids:
         return []
     import ctypes
     from ctypes import wintypes
@@ -116,13 +222,14 @@ def _list_windows_for_pid(pid: int) -> list[int]:
     user32 = ctypes.WinDLL("user32", use_last_error=True)
     handles: list[int] = []
 
+    # One EnumWindows pass for all VS Code processes instead of one pass per PID.
     @ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
     def enum_proc(hwnd, _lparam):
         if not user32.IsWindowVisible(hwnd):
             return True
         win_pid = wintypes.DWORD()
         user32.GetWindowThreadProcessId(hwnd, ctypes.byref(win_pid))
-        if int(win_pid.value) == int(pid):
+        if int(win_pid.value) in pids:
             handles.append(int(hwnd))
         return True
 
@@ -130,6 +237,10 @@ def _list_windows_for_pid(pid: int) -> list[int]:
     return handles
 
 
+def _list_code_windows() -> list[int]:
+    return _list_windows_for_pids(_code_process_ids())
+
+
 def _force_foreground_maximize(hwnd: int) -> None:
     if sys.platform != "win32":
         return
@@ -189,15 +300,7 @@ def main(argv: list[str]) -> int:
     if sys.platform == "win32":
         # Open immediately in maximized state when possible.
         launch_cmd = [cmd, "--new-window", "--maximized", "--folder-uri", folder_uri]
-        before_windows = set()
-        for proc in ("Code.exe", "Code - Insiders.exe"):
-            r = subprocess.run(["tasklist", "/FI", f"IMAGENAME eq {proc}", "/FO", "CSV", "/NH"], capture_output=True, text=True)
-            for line in (r.stdout or "").splitlines():
-                if not line or line.startswith("INFO:"):
-                    continue
-                parts = [p.strip('"') for p in line.split('","')]
-                if len(parts) >= 2 and parts[1].isdigit():
-                    before_windows.update(_list_windows_for_pid(int(parts[1])))
+        before_windows = set(_list_code_windows())
 
     try:
         proc = subprocess.Popen(
@@ -241,25 +344,19 @@ def main(argv: list[str]) -> int:
         return 1
 
     if sys.platform == "win32":
-        deadline = time.time() + 4.0
+        deadline = time.time() + WINDOW_WAIT_SEC
+        delay = WINDOW_POLL_MIN_SEC
         selected = None
         while time.time() < deadline:
-            time.sleep(0.05)
-            current_windows = set()
-            for proc in ("Code.exe", "Code - Insiders.exe"):
-                r = subprocess.run(["tasklist", "/FI", f"IMAGENAME eq {proc}", "/FO", "CSV", "/NH"], capture_output=True, text=True)
-                for line in (r.stdout or "").splitlines():
-                    if not line or line.startswith("INFO:"):
-                        continue
-                    parts = [p.strip('"') for p in line.split('","')]
-                    if len(parts) >= 2 and parts[1].isdigit():
-                        current_windows.update(_list_windows_for_pid(int(parts[1])))
+            time.sleep(delay)
+            delay = min(delay * 2, WINDOW_POLL_MAX_SEC)
+            current_windows = _list_code_windows()
             new_windows = [w for w in current_windows if w not in before_windows]
             if new_windows:
                 selected = new_windows[-1]
                 break
             if current_windows:
-                selected = list(current_windows)[-1]
+                selected = current_windows[-1]
         if selected:
             _force_foreground_maximize(selected)
 
@@ -128,10 +128,11 @@ def find_repo_folder(my_repos_dir: Path, owner: str, old_name: str, new_name: st
     expected_url_pattern = f"github.com/{owner}/{old_name}"
     
     try:
-        for entry in my_repos_dir.iterdir():
-            if not entry.is_dir() or not (entry / ".git").exists():
-                continue
-
+        # scandir's DirEntry answers is_dir() from the directory read, without a stat per entry.
+        with os.scandir(my_repos_dir) as it:
+            candidates = [Path(e.path) for e in it
+                          if e.is_dir() and os.path.exists(os.path.join(e.path, ".git"))]
+        for entry in candidates:
             remote = _git_remote_origin(entry)
             if remote and _matches_repo_name_in_remote(remote, old_name):
                 print(f"Found matching folder by remote URL: {entry.name}")
@@ -17,10 +17,17 @@ TIMEOUT_GIT_PUSH = 120
 # Git / Project
 # Git URL for auto-installing Create-Project-Folder helper repo.
 CREATE_PROJECT_REPO_URL = "https://github.com/israice/Create-Project-Folder.git"
+# Clone installed repos with only their latest commit (faster, but no history or other branches).
+SHALLOW_CLONES = False
 # Reserved base directory name for local-only projects (informational).
 BASE_DIRECTORY = "NEW_PROJECTS"
 # TTL for cached local git state in backend memory (seconds).
 GIT_STATE_TTL_SEC = 10
+# /api/push-states reuses a git scan started at most this long ago instead of rescanning,
+# so the poll right after /api/repos does not repeat its work (seconds).
+PUSH_STATES_REUSE_SEC = 2
+# TTL for the cached GitHub avatar URL shown in the header, in memory and on disk (seconds).
+AVATAR_CACHE_TTL_SEC = 86400
 
 # Runtime
 # Disables .pyc/__pycache__ generation when set to "1"/"true"/"yes"/"on".
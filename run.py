@@ -142,11 +142,12 @@ if __name__ == "__main__":
             username_key = os.getenv("BWS_GITHUB_USERNAME_SECRET", "GITHUB_USERNAME").strip() or "GITHUB_USERNAME"
             require_write = env_flag("BWS_REQUIRE_WRITE", "1")
 
-            verify_bws_capabilities(require_write=require_write, project_id=bws_project_id)
+            secrets = verify_bws_capabilities(require_write=require_write, project_id=bws_project_id)
             inject_github_env_from_bws(
                 project_id=bws_project_id,
                 token_key=token_key,
                 username_key=username_key,
+                secrets=secrets,
             )
             print("Bitwarden secrets loaded via bws.")
             print(f"BWS write probe: {'enabled' if require_write else 'disabled'}")
@@ -164,6 +165,10 @@ if __name__ == "__main__":
         print(f"GITHUB_TOKEN present: {'yes' if bool(os.getenv('GITHUB_TOKEN', '').strip()) else 'no'}")
 
     hot_reload = env_flag("HOT_RELOAD", "1")
+    workers = max(1, int(os.getenv("WORKERS", "1") or "1"))
+    if hot_reload and workers > 1:
+        print("WORKERS > 1 is ignored while HOT_RELOAD=1")
+        workers = 1
     ensure_backend_requirements(hot_reload)
     ensure_frontend_deps()
 
@@ -188,6 +193,7 @@ if __name__ == "__main__":
             reload=hot_reload,
             reload_dirs=reload_dirs if hot_reload else None,
             reload_includes=reload_includes if hot_reload else None,
+            workers=workers,
         )
     finally:
         vite_holder["stop"] = True